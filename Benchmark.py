@@ -0,0 +1,197 @@
+import sys
+import os
+import json
+import time
+import argparse
+import platform
+import statistics
+import subprocess
+import tempfile
+import numpy as np
+
+# The benchmark drives the program without showing anything
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+# Times the hot paths of GamesList.py on synthetic lists of games and prints the results
+# as JSON, e.g.
+#   python Benchmark.py --sizes 1000 100000 --storage csv --output results.json
+# Every size is run in its own temporary directory with generated Games.txt, Status.txt and
+# Consoles.txt. Times are in seconds. With --budgets, the results are checked against a
+# JSON file of the most each measurement may take:
+#   {"*": {"startup": 2.0, "keystroke.max": 0.05}, "1000000": {"startup": 10.0}}
+# where "*" applies to every size. Measurements are named like in the results, nested
+# values joined with dots. The exit code is 1 if any budget is exceeded
+
+WORDS = ["the", "legend", "of", "zelda", "mario", "kart", "dark", "souls", "final", "fantasy",
+         "witcher", "in", "a", "by", "star", "wars", "portal", "half", "life", "doom", "quake",
+         "hollow", "knight", "celeste", "metroid", "prime", "super", "world", "galaxy", "odyssey"]
+STATUSES = ["Playing", "To do", "Consider", "Done", "Dropped"]
+CONSOLES = ["PC", "Mobile", "Switch", "PS4", "PS5", "Xbox", "3DS", "Wii U"]
+SCORES = [-1.0] + [score / 2 for score in range(21)]
+
+
+def generate_files(size, seed=0):
+    # Write Games.txt, Status.txt and Consoles.txt with size games to the current directory.
+    # Titles are 1-4 random words and a number that keeps them unique
+    rng = np.random.default_rng(seed)
+    words = np.array([word.capitalize() for word in WORDS], dtype=object)
+    lengths = rng.integers(1, 5, size)
+    titles = [" ".join(words[rng.integers(0, len(words), length)]) + " " + str(number)
+              for length, number in zip(lengths, range(size))]
+    status = rng.integers(0, len(STATUSES), size)
+    console = rng.integers(0, len(CONSOLES), size)
+    score = rng.integers(0, len(SCORES), size)
+    with open("Games.txt", "w") as f:
+        f.write("Title$Status$Console$Score$reduced$categorized\n")
+        for row in zip(titles, status, console, score):
+            f.write(row[0] + "$" + STATUSES[row[1]] + "$" + CONSOLES[row[2]] + "$" + str(SCORES[row[3]]) + "$$\n")
+    with open("Status.txt", "w") as f:
+        f.write("\n".join(STATUSES) + "\n")
+    with open("Consoles.txt", "w") as f:
+        f.write("\n".join(CONSOLES) + "\n")
+
+
+def timed(function, *args, **kwargs):
+    start = time.perf_counter()
+    function(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def summary(times):
+    return {"mean": statistics.mean(times), "median": statistics.median(times), "max": max(times)}
+
+
+def run_size(size, storage, repeat):
+    # Run every benchmark on a generated list of the given size
+    from PyQt5.QtCore import Qt, QModelIndex
+    import pandas as pd
+    from GamesList import GamesList
+    from GameLibrary import reduce_title, reduce_titles
+    from FileWriter import write_atomic, write_games
+    from BinaryFile import write_binary
+
+    results = {"size": size}
+    generate_files(size)
+    titles = pd.read_csv("Games.txt", sep="$")["Title"]
+    results["reduce_title"] = timed(titles.apply, reduce_title)
+    results["reduce_titles"] = timed(reduce_titles, titles)
+
+    # The first start of a binary or database storage converts Games.txt, the second is measured
+    if storage != "csv":
+        window = GamesList(storage)
+        results["migrate"] = timed(window.loadGames)
+        window.close()
+    window = GamesList(storage)
+    results["startup"] = timed(window.loadGames)
+    model = window.tableModel
+    consoles = window.consoles
+
+    # Typing a search text one character at a time, then deleting it again
+    text = "mario kart"
+    keystrokes = [timed(model.filterSortData, text=text[:i]) for i in range(1, len(text) + 1)]
+    keystrokes += [timed(model.filterSortData, text=text[:i]) for i in range(len(text) - 1, -1, -1)]
+    results["keystroke"] = summary(keystrokes)
+
+    # Sorting by every column, the first time (when its permutation may still have to be built)
+    # and switching the order back and forth afterwards
+    results["sort_first"] = {}
+    switches = []
+    for column, name in [(0, "Title"), (2, "Console"), (3, "Score"), (1, "Status")]:
+        results["sort_first"][name] = timed(model.filterSortData, column=column, order=0)
+        switches.append(timed(model.filterSortData, column=column, order=1))
+        switches.append(timed(model.filterSortData, column=column, order=0))
+    results["sort"] = summary(switches)
+
+    # Edits, one row at a time. updateData and deleteData use the first row shown
+    adds = [timed(model.setData, QModelIndex(), ["Benchmark game " + str(i), STATUSES[i % len(STATUSES)],
+                                                  consoles[i % len(consoles)], "7.5"], Qt.EditRole)
+            for i in range(repeat)]
+    results["setData"] = summary(adds)
+    updates = [timed(model.updateData, model.index(0, 0), ["Benchmark update " + str(i), STATUSES[0],
+                                                           consoles[0], "No score"], Qt.EditRole)
+               for i in range(repeat)]
+    results["updateData"] = summary(updates)
+    deletes = [timed(model.deleteData, model.index(0, 0), Qt.EditRole) for i in range(repeat)]
+    results["deleteData"] = summary(deletes)
+
+    # Renaming a console that many games use, and back
+    results["renameConsole"] = summary([timed(model.renameConsole, consoles[0], "Benchmark console"),
+                                        timed(model.renameConsole, "Benchmark console", consoles[0])])
+
+    # Writing every game, like the compaction of the journal (or every save without one)
+    write = write_binary if storage == "binary" else write_games
+    results["save"] = timed(lambda: write_atomic("Benchmark.out", write, model.snapshot()))
+    results["close"] = timed(window.close)
+    return results
+
+
+def flatten(results, prefix=""):
+    flat = {}
+    for key, value in results.items():
+        if isinstance(value, dict):
+            flat.update(flatten(value, prefix + key + "."))
+        else:
+            flat[prefix + key] = value
+    return flat
+
+
+def check_budgets(results, budgets):
+    # The measurements that took longer than their budget
+    exceeded = []
+    for result in results:
+        flat = flatten(result)
+        limits = dict(budgets.get("*", {}))
+        limits.update(budgets.get(str(result["size"]), {}))
+        for name, limit in limits.items():
+            if name in flat and flat[name] > limit:
+                exceeded.append({"size": result["size"], "measurement": name, "time": flat[name], "budget": limit})
+    return exceeded
+
+
+def commit():
+    # The commit being measured, if the program is in a git repository
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Time the hot paths of GamesList on generated lists of games")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000],
+                        help="Numbers of games to generate (default: 1000 10000 100000)")
+    parser.add_argument("--storage", choices=["csv", "binary", "sqlite"], default="csv")
+    parser.add_argument("--repeat", type=int, default=20, help="How often each edit is timed")
+    parser.add_argument("--output", help="Write the results to this file instead of printing them")
+    parser.add_argument("--budgets", help="JSON file with the most each measurement may take")
+    args = parser.parse_args()
+
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from PyQt5.QtWidgets import QApplication
+    app = QApplication(sys.argv[:1])
+
+    results = []
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as directory:
+            cwd = os.getcwd()
+            os.chdir(directory)
+            try:
+                results.append(run_size(size, args.storage, args.repeat))
+            finally:
+                os.chdir(cwd)
+
+    report = {"commit": commit(), "python": platform.python_version(), "platform": platform.platform(),
+              "storage": args.storage, "repeat": args.repeat, "results": results}
+    if args.budgets:
+        with open(args.budgets) as f:
+            report["exceeded"] = check_budgets(results, json.load(f))
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    sys.exit(1 if report.get("exceeded") else 0)
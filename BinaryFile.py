@@ -0,0 +1,114 @@
+import sys
+import os
+import json
+import mmap
+import struct
+import numpy as np
+import pandas as pd
+
+
+# Games stored column by column in a binary file, so loading is copying arrays instead of
+# parsing text. The file starts with MAGIC, the length of a JSON header (uint32) and the
+# header itself, which gives the number of games and where each column is (as blocks of
+# data after the header):
+#   Title, reduced   character offsets (uint64, one more than there are games) into a
+#                    UTF-8 blob, the string of game i is text[offsets[i]:offsets[i+1]]
+#   Status, Console  codes (uint16) into a list of names kept in the header
+#   Score            float32 (float64 if a score doesn't fit exactly)
+# Every block starts at a multiple of 8 bytes. categorized isn't stored, it follows from Status.txt
+
+MAGIC = b"GAMESBIN"
+VERSION = 1
+
+
+def write_binary(f, data):
+    # Write a DataFrame of games to a file opened by write_atomic (see FileWriter.py)
+    f = f.buffer
+    blocks = []
+    header = {"version": VERSION, "count": data.shape[0], "columns": {}}
+    for column in ["Title", "reduced"]:
+        strings = ["" if not isinstance(value, str) else value for value in data[column]]
+        offsets = np.zeros(len(strings) + 1, dtype=np.uint64)
+        np.cumsum([len(string) for string in strings], out=offsets[1:])
+        blocks.append(offsets.tobytes())
+        blocks.append("".join(strings).encode())
+        header["columns"][column] = {"offsets": len(blocks) - 2, "text": len(blocks) - 1}
+    for column in ["Status", "Console"]:
+        codes, names = pd.factorize(data[column].fillna(""))
+        blocks.append(codes.astype(np.uint16).tobytes())
+        header["columns"][column] = {"codes": len(blocks) - 1, "names": list(names)}
+    score = data["Score"].values.astype(np.float64)
+    if np.array_equal(score.astype(np.float32), score, equal_nan=True):
+        score = score.astype(np.float32)
+    blocks.append(score.tobytes())
+    header["columns"]["Score"] = {"values": len(blocks) - 1, "dtype": score.dtype.name}
+
+    # Blocks are placed relative to the start of the data, the first multiple of 8 after the header
+    spans = []
+    position = 0
+    for block in blocks:
+        position += -position % 8
+        spans.append((position, len(block)))
+        position += len(block)
+    header["blocks"] = spans
+    text = json.dumps(header).encode()
+    text += b" " * (-(len(MAGIC) + 4 + len(text)) % 8)
+
+    f.write(MAGIC)
+    f.write(struct.pack("<I", len(text)))
+    f.write(text)
+    position = 0
+    for block, (offset, size) in zip(blocks, spans):
+        f.write(b"\0" * (offset - position))
+        f.write(block)
+        position = offset + size
+
+
+def read_binary(fileName):
+    # Read the games written by write_binary. The file is mapped instead of read, and closed
+    # again before returning so it can be replaced. Status and Console are returned as
+    # categoricals, so their codes are used as they are instead of every name being looked up
+    with open(fileName, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        if m[:len(MAGIC)] != MAGIC:
+            raise ValueError(fileName + " is not a binary games file.")
+        length, = struct.unpack("<I", m[len(MAGIC):len(MAGIC)+4])
+        header = json.loads(m[len(MAGIC)+4:len(MAGIC)+4+length])
+        start = len(MAGIC) + 4 + length
+        if header["version"] != VERSION:
+            raise ValueError(fileName + " was written by a newer version of the program.")
+
+        def block(number, dtype):
+            offset, size = header["blocks"][number]
+            return np.frombuffer(m, dtype=dtype, count=size // np.dtype(dtype).itemsize, offset=start + offset).copy()
+
+        columns = header["columns"]
+        data = {}
+        for column in ["Title", "reduced"]:
+            offsets = block(columns[column]["offsets"], np.uint64).tolist()
+            offset, size = header["blocks"][columns[column]["text"]]
+            text = m[start+offset:start+offset+size].decode()
+            data[column] = [text[first:last] for first, last in zip(offsets, offsets[1:])]
+        for column in ["Status", "Console"]:
+            data[column] = pd.Categorical.from_codes(block(columns[column]["codes"], np.uint16).astype(np.int32),
+                                                     columns[column]["names"])
+        data["Score"] = block(columns["Score"]["values"], columns["Score"]["dtype"]).astype(np.float64)
+    return pd.DataFrame(data, columns=["Title", "Status", "Console", "Score", "reduced"])
+
+
+if __name__ == "__main__":
+    # Convert between the games file and the binary file, e.g.
+    #   python BinaryFile.py Games.txt Games.bin
+    # Journaled changes are included. Run it while the program isn't running
+    from GameLibrary import prepare_data
+    from FileWriter import write_atomic, write_games
+    from Storage import BinaryStorage, CsvStorage
+
+    source, target = sys.argv[1:3]
+    storage = BinaryStorage if source.endswith(".bin") else CsvStorage
+    data = storage(source, None).load()
+
+    # categorized is written to the games file, it follows from the order of the statuses
+    status = [c[:-1] for c in open("Status.txt").readlines()] if os.path.exists("Status.txt") else []
+    data = prepare_data(data.astype({"Status": object, "Console": object}),
+                        dict(zip(status, range(len(status)))))
+    write_atomic(target, write_binary if target.endswith(".bin") else write_games, data)
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'EditStatusesDialog.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.4
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_Dialog(object):
+    def setupUi(self, Dialog):
+        Dialog.setObjectName("Dialog")
+        Dialog.resize(372, 300)
+        Dialog.setMinimumSize(QtCore.QSize(372, 300))
+        self.verticalLayout = QtWidgets.QVBoxLayout(Dialog)
+        self.verticalLayout.setContentsMargins(10, 10, 10, 10)
+        self.verticalLayout.setSpacing(10)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.horizontalLayout = QtWidgets.QHBoxLayout()
+        self.horizontalLayout.setSpacing(10)
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.listWidget = QtWidgets.QListWidget(Dialog)
+        self.listWidget.setObjectName("listWidget")
+        self.horizontalLayout.addWidget(self.listWidget)
+        self.verticalLayout_2 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_2.setObjectName("verticalLayout_2")
+        self.button_add = QtWidgets.QPushButton(Dialog)
+        self.button_add.setObjectName("button_add")
+        self.verticalLayout_2.addWidget(self.button_add)
+        self.button_delete = QtWidgets.QPushButton(Dialog)
+        self.button_delete.setObjectName("button_delete")
+        self.verticalLayout_2.addWidget(self.button_delete)
+        self.button_up = QtWidgets.QPushButton(Dialog)
+        self.button_up.setObjectName("button_up")
+        self.verticalLayout_2.addWidget(self.button_up)
+        self.button_down = QtWidgets.QPushButton(Dialog)
+        self.button_down.setObjectName("button_down")
+        self.verticalLayout_2.addWidget(self.button_down)
+        spacerItem = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout_2.addItem(spacerItem)
+        self.horizontalLayout.addLayout(self.verticalLayout_2)
+        self.verticalLayout.addLayout(self.horizontalLayout)
+        self.horizontalLayout_3 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_3.setSpacing(10)
+        self.horizontalLayout_3.setObjectName("horizontalLayout_3")
+        self.button_cancel = QtWidgets.QPushButton(Dialog)
+        self.button_cancel.setObjectName("button_cancel")
+        self.horizontalLayout_3.addWidget(self.button_cancel)
+        self.button_update = QtWidgets.QPushButton(Dialog)
+        self.button_update.setObjectName("button_update")
+        self.horizontalLayout_3.addWidget(self.button_update)
+        self.verticalLayout.addLayout(self.horizontalLayout_3)
+
+        self.retranslateUi(Dialog)
+        QtCore.QMetaObject.connectSlotsByName(Dialog)
+
+    def retranslateUi(self, Dialog):
+        _translate = QtCore.QCoreApplication.translate
+        Dialog.setWindowTitle(_translate("Dialog", "Dialog"))
+        self.button_add.setText(_translate("Dialog", "Add status"))
+        self.button_delete.setText(_translate("Dialog", "Delete status"))
+        self.button_up.setText(_translate("Dialog", "Move up"))
+        self.button_down.setText(_translate("Dialog", "Move down"))
+        self.button_cancel.setText(_translate("Dialog", "Cancel"))
+        self.button_update.setText(_translate("Dialog", "Update statuses"))
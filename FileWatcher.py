@@ -0,0 +1,65 @@
+import os
+from PyQt5 import QtCore
+
+
+def file_stamp(fileName):
+    # Modification time and size, None if the file doesn't exist
+    try:
+        info = os.stat(fileName)
+    except OSError:
+        return None
+    return (info.st_mtime_ns, info.st_size)
+
+
+class FileWatcher(QtCore.QObject):
+    # Tells when files change on disk, e.g. by another program or a sync between computers.
+    # Programs often replace a file instead of writing to it, after which the file system
+    # stops watching it, so files are watched again every time. A file is only reported once
+    # it stops changing for the delay (in milliseconds), and only if its modification time or
+    # size is different. Files written by the program itself are reported as well
+
+    changed = QtCore.pyqtSignal(str)  # File name
+
+    def __init__(self, fileNames, delay=500, parent=None):
+        super().__init__(parent)
+        self.fileNames = list(fileNames)
+        self._stamps = {fileName: file_stamp(fileName) for fileName in self.fileNames}
+        self._changed = set()  # Files that changed since the last report
+        self.watcher = QtCore.QFileSystemWatcher(self)
+        self.watcher.fileChanged.connect(self.fileChanged)
+        self.timer = QtCore.QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(delay)
+        self.timer.timeout.connect(self.report)
+        self.watch()
+
+    def watch(self):
+        # Files that don't exist (yet) can't be watched, they are added once they do
+        missing = [fileName for fileName in self.fileNames
+                   if fileName not in self.watcher.files() and os.path.exists(fileName)]
+        if missing:
+            self.watcher.addPaths(missing)
+
+    def fileChanged(self, fileName):
+        self._changed.add(fileName)
+        self.timer.start()
+
+    def retry(self, fileName):
+        # Report the file again later, e.g. because it couldn't be reloaded right now
+        self._stamps[fileName] = None
+        self.fileChanged(fileName)
+
+    def report(self):
+        self.watch()
+        for fileName in sorted(self._changed):
+            stamp = file_stamp(fileName)
+            if stamp is None:
+                continue
+            self._changed.discard(fileName)
+            if stamp != self._stamps[fileName]:
+                self._stamps[fileName] = stamp
+                self.changed.emit(fileName)
+
+        # Files that are gone, e.g. halfway through a sync, are looked for again until they are back
+        if self._changed:
+            self.timer.start()
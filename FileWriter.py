@@ -0,0 +1,38 @@
+import os
+
+
+def write_atomic(fileName, write, snapshot):
+    # Write to a temporary file, then replace the file with it.
+    # A crash halfway through leaves the previous file intact
+    temp = fileName + ".tmp"
+    with open(temp, "w", newline="") as f:
+        write(f, snapshot)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp, fileName)
+
+
+def write_games(f, data):
+    data.to_csv(f, sep="$", header=True, index=False)
+
+
+def write_lines(f, lines):
+    for line in lines:
+        f.write(line)
+        f.write('\n')
+
+
+class FileWriter():
+    # Writes files right away on the calling thread. It can be used instead of the
+    # save worker (see SaveWorker.py) by anything that runs without Qt, e.g. GamesCli.py
+
+    def save(self, fileName, write, snapshot, done=None):
+        # done is called with None after the file is written, or with the error if it failed
+        try:
+            write_atomic(fileName, write, snapshot)
+        except OSError as error:
+            if done is not None:
+                done(error)
+            raise
+        if done is not None:
+            done(None)
@@ -0,0 +1,130 @@
+import time
+from bisect import bisect_left, insort
+from collections import defaultdict
+import numpy as np
+
+
+# Finds titles for a search text with typos or with its words in another order, best match
+# first (see Query.py for how it is used from the search box). Titles are split into the
+# words of their reduced title. Each word of the search text is compared to the words of the
+# titles through three indexes, so only words that can match are ever looked at:
+#   the word itself                       score 1.0
+#   words starting with it (2+ letters)   score 0.8
+#   words one typo away (4+ letters)      score 0.6
+# where a typo is a missing, extra, different or swapped letter. Words one typo away share a
+# variant with one letter deleted, so every word is indexed under those variants. A title
+# scores the average of the best score of each word of the search text
+
+EXACT = 1.0
+PREFIX = 0.8
+TYPO = 0.6
+
+
+def deletions(word):
+    return {word[:i] + word[i+1:] for i in range(len(word))}
+
+
+def is_typo(a, b):
+    # Whether a and b differ by exactly one missing, extra, different or swapped letter
+    if a == b or abs(len(a) - len(b)) > 1:
+        return False
+    start = 0
+    while start < min(len(a), len(b)) and a[start] == b[start]:
+        start += 1
+    if len(a) == len(b):
+        if a[start+1:] == b[start+1:]:
+            return True
+        return a[start:start+2] == b[start:start+2][::-1] and a[start+2:] == b[start+2:]
+    if len(a) < len(b):
+        a, b = b, a
+    return a[start+1:] == b[start:]
+
+
+class FuzzyIndex():
+
+    def __init__(self, reduced, ids):
+        self._words = {}  # Row id -> words of its reduced title
+        self._postings = defaultdict(set)  # Word -> ids of the titles containing it
+        self._vocabulary = []  # Every word, sorted, to find the words starting with a text
+        self._deletions = defaultdict(set)  # Word with a letter deleted -> words
+        for id, title in zip(ids, reduced):
+            words = title.split()
+            self._words[id] = words
+            for word in words:
+                self._postings[word].add(id)
+        self._vocabulary = sorted(self._postings)
+        for word in self._vocabulary:
+            self.addDeletions(word)
+
+    def addDeletions(self, word):
+        if len(word) >= 4:
+            for deletion in deletions(word):
+                self._deletions[deletion].add(word)
+
+    def add(self, reduced, id):
+        words = reduced.split()
+        self._words[id] = words
+        for word in words:
+            if word not in self._postings:
+                insort(self._vocabulary, word)
+                self.addDeletions(word)
+            self._postings[word].add(id)
+
+    def remove(self, id):
+        for word in self._words.pop(id):
+            posting = self._postings.get(word)
+            if posting is None:
+                continue  # The word appeared twice in the title
+            posting.discard(id)
+            if posting:
+                continue
+            del self._postings[word]
+            del self._vocabulary[bisect_left(self._vocabulary, word)]
+            if len(word) >= 4:
+                for deletion in deletions(word):
+                    self._deletions[deletion].discard(word)
+                    if not self._deletions[deletion]:
+                        del self._deletions[deletion]
+
+    def candidates(self, word):
+        # The words of the titles that match the word, with their score, best first
+        matches = {}
+        if len(word) >= 2:
+            start = bisect_left(self._vocabulary, word)
+            end = bisect_left(self._vocabulary, word + "\U0010ffff", start)
+            for other in self._vocabulary[start:end]:
+                matches[other] = PREFIX
+        if len(word) >= 4:
+            # Words that are a letter longer contain the word once a letter is deleted, words that
+            # are a letter shorter are one of its deletions, and words of the same length share one
+            options = set(self._deletions.get(word, ()))
+            for deletion in deletions(word):
+                if deletion in self._postings:
+                    options.add(deletion)
+                options.update(self._deletions.get(deletion, ()))
+            for other in options:
+                if other not in matches and is_typo(word, other):
+                    matches[other] = TYPO
+        if word in self._postings:
+            matches[word] = EXACT
+        return sorted(matches.items(), key=lambda match: -match[1])
+
+    def relevance(self, reduced, size, budget=0.016):
+        # The score of every row id (below size) for the reduced search text, 0 if it doesn't match.
+        # Words are matched best first until the budget (in seconds) is used up, the words
+        # left after that are skipped so a search never takes much longer than the budget
+        deadline = time.perf_counter() + budget
+        words = list(dict.fromkeys(reduced.split()))
+        total = np.zeros(size, dtype=np.float32)
+        for word in words:
+            if time.perf_counter() > deadline:
+                break
+            best = np.zeros(size, dtype=np.float32)
+            for other, score in self.candidates(word):
+                posting = self._postings[other]
+                ids = np.fromiter(posting, dtype=np.int64, count=len(posting))
+                best[ids] = np.maximum(best[ids], score)
+                if time.perf_counter() > deadline:
+                    break
+            total += best
+        return total / max(1, len(words))
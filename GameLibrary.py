@@ -0,0 +1,706 @@
+import os
+import re
+from bisect import bisect_left
+from collections import OrderedDict, defaultdict
+import numpy as np
+from GameStore import GameStore, Categories
+from Query import Query, match_names
+from FuzzyIndex import FuzzyIndex
+# Nothing here needs Qt, so the list can be used by scripts (see GamesCli.py) as well as the
+# program. pandas is only imported when games are imported from a file
+
+
+def default_storage(directory="."):
+    # The storage used when none is chosen: the database or binary file if there is one
+    if os.path.exists(os.path.join(directory, "Games.db")):
+        return "sqlite"
+    return "binary" if os.path.exists(os.path.join(directory, "Games.bin")) else "csv"
+
+
+# Words that are commonly disregarded from sorting
+EXCLUDED_WORDS = frozenset(["a", "by", "in", "of", "the"])
+
+
+def reduce_title(t):
+    return " ".join([word for word in t.lower().split(" ") if word not in EXCLUDED_WORDS])
+
+
+def reduce_titles(titles):
+    # reduce_title for a whole Series of titles. A plain loop over the titles is faster than
+    # Series.apply or replacing the words with regular expressions
+    import pandas as pd
+    return pd.Series(list(map(reduce_title, titles.tolist())), index=titles.index, dtype=object)
+
+
+def prepare_data(data, status_dict=None):
+    # Create hidden representations of title and status (used for sorting). Reduced titles
+    # loaded along with the games are kept, only the missing ones are found. categorized is
+    # only needed for storages that save it, the program finds it from the status registry
+    if "reduced" not in data:
+        data["reduced"] = None
+    missing = data["reduced"].isna()
+    if missing.any():
+        data.loc[missing, "reduced"] = reduce_titles(data.loc[missing, "Title"])
+    if status_dict is not None:
+        data["categorized"] = data["Status"].map(status_dict)
+    return data
+
+
+def diff_games(old, new):
+    # Compare two versions of the games (DataFrames) by title. Returns the rows of old that
+    # aren't in new (removed or changed) and the rows of new that aren't in old (added or
+    # changed). Any other columns of old, like row ids, are kept. A title that is in a version
+    # twice counts as its last row
+    columns = ["Title", "Status", "Console", "Score"]
+    merged = old.drop_duplicates("Title", keep="last").merge(
+        new[columns].drop_duplicates("Title", keep="last"), on="Title", how="outer",
+        suffixes=("", " new"), indicator=True)
+    same = ((merged["_merge"] == "both") & (merged["Status"] == merged["Status new"]) &
+            (merged["Console"] == merged["Console new"]) & (merged["Score"] == merged["Score new"]))
+    removed = merged[(merged["_merge"] != "right_only") & ~same][list(old.columns)]
+    added = merged[(merged["_merge"] != "left_only") & ~same][["Title", "Status new", "Console new", "Score new"]]
+    return removed, added.set_axis(columns, axis=1)
+
+
+class SortIndex():
+    # A sorted permutation of row ids, kept up to date one row at a time.
+    # Rows are ordered by (primary, reduced, id), where primary is the value
+    # of the sorted column
+    
+    def __init__(self, primaries, reduced, ids):
+        self._keys = sorted(zip(primaries, reduced, ids))
+        self._ids = [key[-1] for key in self._keys]
+        self._ascending = None  # Cached arrays, dropped whenever the index changes
+        self._descending = None
+    
+    def insert(self, primary, reduced, id):
+        key = (primary, reduced, id)
+        pos = bisect_left(self._keys, key)
+        self._keys.insert(pos, key)
+        self._ids.insert(pos, id)
+        self._ascending = self._descending = None
+    
+    def remove(self, primary, reduced, id):
+        pos = bisect_left(self._keys, (primary, reduced, id))
+        del self._keys[pos]
+        del self._ids[pos]
+        self._ascending = self._descending = None
+    
+    def position(self, primary, reduced, id):
+        # The position of the row in ascending order
+        return bisect_left(self._keys, (primary, reduced, id))
+    
+    def range(self, low, high):
+        # The ids of the rows whose primary value is between low and high (inclusive).
+        # A key of only the primary value sorts before every row with that value
+        first = bisect_left(self._keys, (low,))
+        last = bisect_left(self._keys, (np.nextafter(high, np.inf),), first)
+        return self._ids[first:last]
+    
+    def order(self, ascending):
+        if self._ascending is None:
+            self._ascending = np.array(self._ids, dtype=np.int64)
+        if ascending:
+            return self._ascending
+        
+        # Descending only applies to the primary value, rows sharing a primary
+        # value stay sorted by ascending title. Reversing the order of the groups
+        # gives exactly that without sorting again
+        if self._descending is None:
+            primaries = [key[0] for key in self._keys]
+            starts = [i for i in range(1, len(primaries)) if primaries[i] != primaries[i-1]]
+            groups = np.split(self._ascending, starts)
+            self._descending = np.concatenate(groups[::-1]) if groups else self._ascending
+        return self._descending
+
+class SearchCancelled(Exception):
+    # Raised by a search whose cancelled function returned True before it was done
+    pass
+
+
+def check_cancelled(cancelled):
+    if cancelled is not None and cancelled():
+        raise SearchCancelled()
+
+
+def normalize_title(t):
+    # Titles that only differ in case and spacing are considered similar
+    return " ".join(t.casefold().split())
+
+
+class TitleIndex():
+    # Trigram index over lowercase titles, used to find the titles containing a search text.
+    # Each trigram maps to the set of row ids whose title contains it. The trigrams are the
+    # slowest part to build, so that is put off until the first search that uses them.
+    # Also maps every title (and normalized title) to its row id(s), to look up titles directly
+    
+    chunk_size = 2000  # Titles checked between looking whether a search was cancelled
+    
+    def __init__(self, titles, ids):
+        self._titles = dict(zip(ids, [title.lower() for title in titles]))  # Lowercase title of each row id
+        self._postings = None  # Built by postings()
+        self._ids = dict(zip(titles, ids))  # Row id of each title
+        self._normalized = {}  # Row ids of each normalized title
+        for id, title in zip(ids, titles):
+            self._normalized.setdefault(normalize_title(title), set()).add(id)
+    
+    def trigrams(self, text):
+        return {text[i:i+3] for i in range(len(text) - 2)}
+    
+    def postings(self, cancelled=None):
+        # Building them can be cancelled (see search), they are only kept once complete
+        if self._postings is None:
+            postings = defaultdict(set)
+            for count, (id, title) in enumerate(self._titles.items()):
+                if count % self.chunk_size == 0:
+                    check_cancelled(cancelled)
+                for i in range(len(title) - 2):
+                    postings[title[i:i+3]].add(id)
+            self._postings = postings
+        return self._postings
+    
+    def add(self, title, id):
+        self._ids[title] = id
+        self._normalized.setdefault(normalize_title(title), set()).add(id)
+        title = title.lower()
+        self._titles[id] = title
+        if self._postings is not None:
+            for trigram in self.trigrams(title):
+                self._postings[trigram].add(id)
+    
+    def remove(self, title, id):
+        del self._ids[title]
+        similar = self._normalized[normalize_title(title)]
+        similar.discard(id)
+        if not similar:
+            del self._normalized[normalize_title(title)]
+        title = self._titles.pop(id)
+        if self._postings is not None:
+            for trigram in self.trigrams(title):
+                posting = self._postings[trigram]
+                posting.discard(id)
+                if not posting:
+                    del self._postings[trigram]
+    
+    def titles(self):
+        return self._ids.keys()
+    
+    def find(self, title):
+        # The row id of the title, or None if it isn't in the list
+        return self._ids.get(title)
+    
+    def findSimilar(self, title):
+        # The row ids of titles that only differ from the title in case and spacing
+        return self._normalized.get(normalize_title(title), set())
+    
+    def search(self, text, candidates=None, cancelled=None):
+        # Returns the ids of all titles containing the text (matched literally, not as a regex).
+        # If candidates are given, only those ids are searched. cancelled is called every now
+        # and then, SearchCancelled is raised if it returns True
+        text = text.lower()
+        if text == "":
+            return list(self._titles) if candidates is None else list(candidates)
+        
+        if candidates is None:
+            # Texts shorter than a trigram can only be found by checking every title
+            if len(text) < 3:
+                candidates = self._titles
+            else:
+                # Intersect the smallest posting lists first, a title must contain every trigram
+                postings = self.postings(cancelled)
+                postings = sorted((postings.get(trigram, set()) for trigram in self.trigrams(text)), key=len)
+                candidates = postings[0].intersection(*postings[1:])
+        
+        # Trigrams can match in the wrong order, so verify the remaining candidates
+        if cancelled is None or len(candidates) <= self.chunk_size:
+            return [id for id in candidates if text in self._titles[id]]
+        candidates = list(candidates)
+        result = []
+        for start in range(0, len(candidates), self.chunk_size):
+            check_cancelled(cancelled)
+            result.extend(id for id in candidates[start:start+self.chunk_size] if text in self._titles[id])
+        return result
+
+
+class SearchCache():
+    # The results (row ids) of the most recently used search texts, least recently used are evicted.
+    # A text containing a cached text can only match a subset of its results, so those are
+    # searched instead of every title
+    
+    def __init__(self, title_index, size=64):
+        self._title_index = title_index
+        self._results = OrderedDict()
+        self.size = size
+        self.hits = 0  # Texts that were cached
+        self.misses = 0  # Texts that had to be searched
+        self.narrowed = 0  # Misses that only searched the results of a cached text
+    
+    def search(self, text, cancelled=None):
+        # Every title matches an empty text, which is not worth caching.
+        # A cancelled search (see TitleIndex.search) isn't cached
+        text = text.lower()
+        if text == "":
+            return self._title_index.search(text)
+        if text in self._results:
+            self.hits += 1
+            self._results.move_to_end(text)
+            return self._results[text]
+        
+        # Search the smallest cached result of a text contained in this one, if any.
+        # The trigram index is usually more selective than the result of a text shorter than a trigram
+        self.misses += 1
+        candidates = None
+        for cached, result in self._results.items():
+            if len(cached) < min(3, len(text)) or cached not in text:
+                continue
+            if candidates is None or len(result) < len(candidates):
+                candidates = result
+        if candidates is not None:
+            self.narrowed += 1
+        
+        result = self._title_index.search(text, candidates, cancelled)
+        self._results[text] = result
+        if len(self._results) > self.size:
+            self._results.popitem(last=False)
+        return result
+    
+    def add(self, title, id):
+        # Patch the cached results with a new row
+        title = title.lower()
+        for cached, result in self._results.items():
+            if cached in title:
+                result.append(id)
+    
+    def remove(self, id):
+        # Patch the cached results with a removed row
+        for result in self._results.values():
+            if id in result:
+                result.remove(id)
+    
+    def clear(self):
+        self._results.clear()
+
+
+class GameLibrary():
+    # The list of games with everything needed to search, sort and change it, but without
+    # showing it: TableModel shows it in the main window and GamesCli.py on the command line.
+    # Methods that change the list save the change and return why it failed, or "" if it didn't
+    
+    def __init__(self, data, status, consoles, storage):
+        self.storage = storage  # Where changes are saved (see Storage.py)
+        
+        # The data that is imported/exported/edited. Statuses are sorted in the order of
+        # Status.txt and consoles alphabetically
+        self.store = GameStore(data, {"Status": Categories(status), "Console": Categories(sorted(consoles))})
+        
+        # Rows are identified by their id in the store, which never changes while the list
+        # is open. One sorted permutation is kept per sortable column, the one sorted by status
+        # is the order the games are saved in. The others are only sorted once the list is
+        # sorted by their column (None until then, see sortIndex)
+        ids = self.store.ids()
+        self._sort_indexes = [None] * 4
+        self._title_index = TitleIndex(self.store.get(ids, "Title"), ids)
+        self._search_cache = SearchCache(self._title_index)
+        self._fuzzy_index = None  # Built by the first fuzzy search (see fuzzyIndex)
+        self._queries = OrderedDict()  # Search text -> parsed Query, least recently used are evicted
+        self.query_cache_size = 64
+        self.reload_size = 1000  # Reloads changing more games than this index everything again
+    
+    def rowNumbers(self, ids):
+        # Rows are numbered by their position in the saved order, sorted by status (1-indexed for normies)
+        status_index = self.sortIndex(1)
+        keys = zip(self.sortKeys(1, ids), self.store.get(ids, "reduced"), ids)
+        return [str(status_index.position(*key) + 1) for key in keys]
+    
+    def sortKeys(self, column, ids):
+        # The primary sorting value of each row for the given column. Statuses and consoles
+        # are sorted by the position of their code in the registry
+        if column in (1, 2):
+            return self.store.ranks(ids, GameStore.columns[column]).tolist()
+        return self.store.get(ids, ["reduced", None, None, "Score"][column]).tolist()
+    
+    def sortIndex(self, column):
+        if self._sort_indexes[column] is None:
+            ids = self.store.ids()
+            self._sort_indexes[column] = SortIndex(self.sortKeys(column, ids),
+                                                   self.store.get(ids, "reduced").tolist(), ids.tolist())
+        return self._sort_indexes[column]
+    
+    def indexRows(self, ids):
+        # Add rows to the sorted permutations, the title index and the cached search results
+        for column, sort_index in enumerate(self._sort_indexes):
+            if sort_index is None:
+                continue
+            for id, primary, reduced in zip(ids, self.sortKeys(column, ids), self.store.get(ids, "reduced")):
+                sort_index.insert(primary, reduced, id)
+        for id, title in zip(ids, self.store.get(ids, "Title")):
+            self._title_index.add(title, id)
+            self._search_cache.add(title, id)
+        if self._fuzzy_index is not None:
+            for id, reduced in zip(ids, self.store.get(ids, "reduced")):
+                self._fuzzy_index.add(reduced, id)
+    
+    def unindexRows(self, ids):
+        # Remove rows from the sorted permutations, the title index and the cached search results
+        for column, sort_index in enumerate(self._sort_indexes):
+            if sort_index is None:
+                continue
+            for id, primary, reduced in zip(ids, self.sortKeys(column, ids), self.store.get(ids, "reduced")):
+                sort_index.remove(primary, reduced, id)
+        for id, title in zip(ids, self.store.get(ids, "Title")):
+            self._title_index.remove(title, id)
+            self._search_cache.remove(id)
+        if self._fuzzy_index is not None:
+            for id in ids:
+                self._fuzzy_index.remove(id)
+    
+    def find(self, title):
+        # The id of the game with the title, or None if it isn't in the list
+        return self._title_index.find(title)
+    
+    def validateTitle(self, title, id=None):
+        # Returns why the title can't be used, or "" if it can. When editing a game, id is
+        # that game and its own title is allowed
+        existing = self._title_index.find(title)
+        if existing is not None and existing != id:
+            return "\"" + title + "\" already exists."
+        if title.strip() == "":
+            return "Enter a title."
+        if "$" in title:
+            return "The symbol \"$\" is reserved."
+        # The files are read a line at a time
+        if re.search(r"[\x00-\x1f\x7f]", title):
+            return "Line breaks and control characters aren't allowed."
+        return ""
+    
+    def similarTitles(self, title, id=None):
+        # Titles that only differ from the title in case and spacing (other than the edited game)
+        ids = self._title_index.findSimilar(title) - {id}
+        return [t for t in self.store.get(list(ids), "Title") if t != title]
+    
+    def addGame(self, value):
+        # value is [Title, Status, Console, Score], the score as text (or "No score")
+        error = self.validateTitle(value[0])
+        if error != "":
+            return error
+        
+        self.insertRow(value)
+        self.save(["add", value])
+        return ""
+    
+    def insertRow(self, value):
+        # Convert selected score to a float
+        if value[3] == "No score":
+            value[3] = -1
+        value[3] = float(value[3])
+        
+        # Add hidden representations of title and status (used for sorting)
+        value.append(reduce_title(value[0]))
+        
+        # The sort indexes find the place of the new row, so it is simply appended
+        id = self.store.append(value)
+        value.append(int(self.store.get(id, "categorized")))
+        self.indexRows([id])
+        return id
+    
+    def updateGame(self, id, value):
+        # Replace the game with the given id, the updated game gets a new id (see find)
+        error = self.validateTitle(value[0], id)
+        if error != "":
+            return error
+        
+        # Delete the row, then insert the updated row
+        old = self.store.get(id, "Title")
+        self.unindexRows([id])
+        self.store.delete(id)
+        self.insertRow(value)
+        self.save(["update", old, value])
+        return ""
+    
+    def deleteGame(self, id):
+        title = self.store.get(id, "Title")
+        self.unindexRows([id])
+        self.store.delete(id)
+        self.save(["delete", title])
+        return ""
+    
+    def editGames(self, ids, changes):
+        # Give several games the same status, console and/or score at once.
+        # changes maps the column to its new value, e.g. {"Status": "Done"}
+        if "Score" in changes:
+            if changes["Score"] == "No score":
+                changes["Score"] = -1
+            changes["Score"] = float(changes["Score"])
+        for column, value in changes.items():
+            self.store.assign(ids, column, value)
+        
+        # Titles are unchanged, so only the permutations of the changed columns are sorted again
+        for column in [1, 2, 3]:
+            if GameStore.columns[column] in changes:
+                self._sort_indexes[column] = None
+        
+        self.save(["edit", self.store.frame(ids).values.tolist()])
+        return ""
+    
+    def importGames(self, fileName, consoles):
+        # Add every valid game in the file at once, read and checked a chunk at a time.
+        # Returns the number of added games and (position in file, title, reason) of each
+        # game that wasn't added
+        import pandas as pd
+        from Importer import read_games, validate_games
+        
+        taken = set(self._title_index.titles())
+        accepted = []
+        rejected = []
+        for chunk in read_games(fileName):
+            games, problems = validate_games(chunk, self.statuses(), consoles, taken)
+            accepted.append(games)
+            rejected.extend(problems)
+        if not accepted:
+            return 0, rejected
+        games = pd.concat(accepted, ignore_index=True)
+        if games.shape[0] == 0:
+            return 0, rejected
+        
+        # Add the hidden representation of title (used for sorting)
+        games["reduced"] = reduce_titles(games["Title"])
+        
+        # Sorting everything once is cheaper than finding the place of each new row
+        ids = self.store.extend(games)
+        self._sort_indexes = [None] * 4
+        for id, title in zip(ids, games["Title"]):
+            self._title_index.add(title, id)
+        self._search_cache.clear()
+        self._fuzzy_index = None
+        
+        self.save(["import", self.store.frame(ids).values.tolist()])
+        return games.shape[0], rejected
+    
+    def reload(self, data):
+        # Make the list the same as data (e.g. the games file after another program changed
+        # it). Only the games that were added, removed or changed there are touched, and the
+        # change isn't saved. Returns the number of games that were added, removed and changed
+        import pandas as pd
+        
+        ids = self.store.ids()
+        current = pd.DataFrame({column: self.store.get(ids, column) for column in ["Title", "Status", "Console", "Score"]})
+        current["id"] = ids
+        removed, added = diff_games(current, data)
+        changed = len(set(removed["Title"]) & set(added["Title"]))
+        removed_ids = removed["id"].astype(np.int64).values
+        
+        if len(removed_ids) + added.shape[0] > self.reload_size:
+            # Indexing everything once is cheaper than updating the indexes a row at a time
+            for id in removed_ids:
+                self.store.delete(id)
+            added = added.reset_index(drop=True)
+            added["reduced"] = reduce_titles(added["Title"])
+            self.store.extend(added)
+            ids = self.store.ids()
+            self._sort_indexes = [None] * 4
+            self._title_index = TitleIndex(self.store.get(ids, "Title"), ids)
+            self._search_cache = SearchCache(self._title_index, self._search_cache.size)
+            self._fuzzy_index = None
+        else:
+            self.unindexRows(removed_ids)
+            for id in removed_ids:
+                self.store.delete(id)
+            for row in added.values.tolist():
+                self.insertRow(row)
+        self.sortConsoles()
+        return added.shape[0] - changed, len(removed_ids) - changed, changed
+    
+    def findOrder(self, text, column, order, cancelled=None):
+        # The ids of the games whose title contains the text, sorted by the column (0 = ascending,
+        # 1 = descending). If column != 0, the rows are sorted secondarily by reduced title
+        # (always ascending). The sorted permutation already exists, so filtering only has to mask it.
+        # cancelled can stop the search early, see TitleIndex.search
+        query = self.parse(text)
+        order = self.sortIndex(column).order(order == 0)
+        if query.filters() or not query.fuzzy:
+            mask = np.zeros(self.store.size, dtype=bool)
+            mask[self.match(text, cancelled)] = True
+            check_cancelled(cancelled)
+            order = order[mask[order]]
+        
+        # Fuzzy matches are shown best first, rows that match equally well keep the sorted order
+        if query.fuzzy and query.text.strip() != "":
+            relevance = self.fuzzyIndex(cancelled).relevance(reduce_title(query.text), self.store.size)
+            order = order[relevance[order] > 0]
+            order = order[np.argsort(-relevance[order], kind="stable")]
+        return order
+    
+    def insertPosition(self, ids, id, text, column, order):
+        # Where the game goes in ids, the other games findOrder gives for the same arguments,
+        # or None if it doesn't match the text. Only the game is checked against the search
+        # and compared to the games in ids, instead of searching and sorting them all again
+        query = self.parse(text)
+        if query.fuzzy:
+            # The relevance of a game depends on the words of every title, see FuzzyIndex.py
+            pos = np.flatnonzero(self.findOrder(text, column, order) == id)
+            return pos[0] if len(pos) else None
+        if not self.matches(id, query):
+            return None
+        
+        # Descending only applies to the primary value, like in SortIndex.order
+        key = self.sortKey(column, id)
+        low, high = 0, len(ids)
+        while low < high:
+            middle = (low + high) // 2
+            other = self.sortKey(column, ids[middle])
+            if (other[0] > key[0] if order else other[0] < key[0]) or (other[0] == key[0] and other[1:] < key[1:]):
+                low = middle + 1
+            else:
+                high = middle
+        return low
+    
+    def sortKey(self, column, id):
+        # The key of a game in the sorted permutation of the column, see SortIndex
+        return (self.sortKeys(column, [id])[0], self.store.get([id], "reduced")[0], id)
+    
+    def matches(self, id, query):
+        # Whether a game matches a parsed search text that isn't fuzzy, like match does for all of them
+        if query.text.lower() not in self.store.get([id], "Title")[0].lower():
+            return False
+        for column, names in [("Status", query.status), ("Console", query.console)]:
+            if names is None:
+                continue
+            categories = self.store.categories[column]
+            if self.store.get([id], column)[0] not in match_names(names, [name for name in categories.names if name is not None]):
+                return False
+        if query.score is not None:
+            return query.score[0] <= self.store.get([id], "Score")[0] <= query.score[1]
+        return True
+    
+    def parse(self, text):
+        if text in self._queries:
+            self._queries.move_to_end(text)
+            return self._queries[text]
+        query = self._queries[text] = Query(text)
+        if len(self._queries) > self.query_cache_size:
+            self._queries.popitem(last=False)
+        return query
+    
+    def match(self, text, cancelled=None):
+        # The ids of the games matching a search text, which can filter on status, console
+        # and score (see Query.py). Each filter takes the matching rows from the permutation
+        # sorted by its column, where they are next to each other. The smallest set of rows
+        # is then narrowed down by the others, from small to large
+        query = self.parse(text)
+        if not query.filters() and not query.fuzzy:
+            return self._search_cache.search(query.text, cancelled)
+        
+        postings = []
+        for column, names in [(1, query.status), (2, query.console)]:
+            if names is None:
+                continue
+            categories = self.store.categories[GameStore.columns[column]]
+            ranks = [categories.ranks[categories.codes[name]]
+                     for name in match_names(names, [name for name in categories.names if name is not None])]
+            postings.append([id for rank in ranks for id in self.sortIndex(column).range(rank, rank)])
+        if query.score is not None:
+            postings.append(self.sortIndex(3).range(*query.score))
+        
+        # Titles are searched like the other filters if the text can use the trigram index,
+        # otherwise only the rows matching the filters are checked. Fuzzy texts are matched
+        # by findOrder
+        text = "" if query.fuzzy else query.text.lower()
+        if not postings:
+            postings.append(self._search_cache.search(""))
+        if len(text) >= 3:
+            postings.append(self._search_cache.search(text, cancelled))
+        postings.sort(key=len)
+        ids = np.array(postings[0], dtype=np.int64)
+        for posting in postings[1:]:
+            if ids.size == 0:
+                break
+            check_cancelled(cancelled)
+            mask = np.zeros(self.store.size, dtype=bool)
+            mask[posting] = True
+            ids = ids[mask[ids]]
+        if 0 < len(text) < 3:
+            ids = self._title_index.search(text, ids.tolist(), cancelled)
+        return ids
+    
+    def fuzzyIndex(self, cancelled=None):
+        # The index of the words of the reduced titles, built when it is first needed
+        if self._fuzzy_index is None:
+            check_cancelled(cancelled)
+            ids = self.store.ids()
+            self._fuzzy_index = FuzzyIndex(self.store.get(ids, "reduced"), ids)
+        return self._fuzzy_index
+    
+    def memory(self):
+        # A rough estimate of the bytes used, measured on generated lists: per game about 700 for
+        # the rows and looking up titles, 110 for each sorted column, 1000 for the trigram index
+        # (once a text was searched) and 900 for the fuzzy index (once a fuzzy search was done)
+        size = 700 + 110 * sum(index is not None for index in self._sort_indexes)
+        if self._title_index._postings is not None:
+            size += 1000
+        if self._fuzzy_index is not None:
+            size += 900
+        return size * self.store.count
+    
+    def searchCacheStats(self):
+        # Counters used to tune the size of the search cache
+        return {"size": self._search_cache.size, "hits": self._search_cache.hits,
+                "misses": self._search_cache.misses, "narrowed": self._search_cache.narrowed}
+    
+    def isConsoleUsed(self, console):
+        return self.store.categories["Console"].count(console) > 0
+    
+    def addConsole(self, console):
+        # Returns whether the order of the games sorted by console changed
+        self.store.categories["Console"].add(console)
+        return self.sortConsoles()
+    
+    def renameConsole(self, old, new):
+        # Only the registry changes, the rows keep the code of the console.
+        # Titles are unchanged, so the cached search results are still valid
+        self.store.categories["Console"].rename({old: new})
+        self.sortConsoles()
+        self.save(["rename", old, new])
+        return ""
+    
+    def sortConsoles(self):
+        # Keep consoles in alphabetical order, the permutation sorted by console is only
+        # sorted again if the change moved a console. Returns whether it did
+        consoles = self.store.categories["Console"]
+        if consoles.setOrder(sorted(consoles.codes)):
+            self._sort_indexes[2] = None
+            return True
+        return False
+    
+    def isStatusUsed(self, status):
+        return self.store.categories["Status"].count(status) > 0
+    
+    def statuses(self):
+        # The statuses in the order they are sorted by
+        return list(self.store.categories["Status"].order)
+    
+    def setStatuses(self, statuses, renamed):
+        # Use a new list of statuses, in the order they are sorted by. renamed maps old names
+        # to new ones, statuses that aren't in the list anymore must not be used by any game.
+        # Only the registry changes, the rows keep the code of their status
+        status = self.store.categories["Status"]
+        status.rename(renamed)
+        if status.setOrder(statuses):
+            self._sort_indexes[1] = None
+        self.save(["statuses", renamed, dict(zip(statuses, range(len(statuses))))])
+        return ""
+    
+    def statistics(self, ids=None):
+        # The number of games per status and console and their scores (see Statistics.report),
+        # of every game or only of the given ids. Every game is always counted already
+        statistics = self.store.statistics if ids is None else self.store.statisticsOf(ids)
+        return statistics.report(self.store.categories["Status"], self.store.categories["Console"])
+    
+    def save(self, record):
+        self.storage.save(record, self.snapshot)
+    
+    def snapshot(self):
+        # A copy of the games in the saved order, sorted by status
+        return self.store.frame(self.sortIndex(1).order(True))
+    
+    def close(self):
+        self.storage.close(self.snapshot)
@@ -0,0 +1,209 @@
+import numpy as np
+from Statistics import Statistics
+
+
+class Categories():
+    # The registry of a column with few different values, like Status or Console. Rows only
+    # store the code of their value, so renaming or reordering values is done here without
+    # touching any row. The number of rows using each code is kept up to date by GameStore
+
+    def __init__(self, names):
+        self.names = []  # Code -> name (None for a code whose name was taken by another)
+        self.codes = {}  # Name -> code
+        self.counts = np.zeros(0, dtype=np.int64)  # Code -> number of rows using it
+        self.ranks = np.zeros(0, dtype=np.int64)  # Code -> position when sorting
+        self._decoded = None  # The names as an array, made when needed
+        self.order = []  # The names in the order given to setOrder
+        self.setOrder(names)
+
+    def add(self, name):
+        # The code of the name, which is added (sorted last) if it is new
+        code = self.codes.get(name)
+        if code is None:
+            code = len(self.names)
+            self.names.append(name)
+            self.codes[name] = code
+            self.counts = np.append(self.counts, 0)
+            self.ranks = np.append(self.ranks, len(self.ranks) + code)
+            self._decoded = None
+        return code
+
+    def encode(self, values):
+        # The codes of an array of names, unknown names are added. The codes of a categorical
+        # (like the ones read from a binary file) are translated without looking at every name
+        if hasattr(values, "categories"):
+            codes = np.array([self.add(name) for name in values.categories], dtype=np.int32)
+            return codes[values.codes]
+        for name in dict.fromkeys(values):
+            self.add(name)
+        return np.fromiter(map(self.codes.__getitem__, values), dtype=np.int32, count=len(values))
+
+    def decode(self, codes):
+        if self._decoded is None:
+            self._decoded = np.array(self.names, dtype=object)
+        return self._decoded[codes]
+
+    def count(self, name):
+        code = self.codes.get(name)
+        return 0 if code is None else self.counts[code]
+
+    def rename(self, renamed):
+        # Rename several values at once (so two values can swap names). A new name may only
+        # be taken from a value that isn't used by any row
+        codes = {old: self.codes[old] for old in renamed if old in self.codes}
+        for old, new in renamed.items():
+            if new in self.codes and new not in renamed and self.counts[self.codes[new]] > 0:
+                raise ValueError("\"" + new + "\" is already used.")
+        for old, code in codes.items():
+            del self.codes[old]
+        for new in renamed.values():
+            if new in self.codes:
+                self.names[self.codes.pop(new)] = None
+        for old, code in codes.items():
+            self.names[code] = renamed[old]
+            self.codes[renamed[old]] = code
+        self.order = [renamed.get(name, name) for name in self.order]
+        self._decoded = None
+
+    def setOrder(self, names):
+        # Sort the values in the given order, values that aren't listed go last.
+        # Returns whether the order of any value changed
+        for name in names:
+            self.add(name)
+        self.order = list(names)
+        ranks = len(names) + np.arange(len(self.names))
+        ranks[[self.codes[name] for name in names]] = np.arange(len(names))
+        changed = not np.array_equal(ranks, self.ranks)
+        self.ranks = ranks
+        return changed
+
+
+class GameStore():
+    # The games, stored column by column in arrays indexed by row id. New rows are appended
+    # and deleted rows are only marked as such, so adding or deleting a game doesn't move
+    # any other row and row ids stay valid. The order of the rows is kept by the sort indexes.
+    # Status and Console are stored as codes of their registry in categories, and categorized
+    # (the position of the status) is found from the status registry instead of being stored.
+    # statistics counts the games per status, console and score as rows change (see Statistics.py)
+
+    columns = ["Title", "Status", "Console", "Score", "reduced", "categorized"]
+    stored = ["Title", "Status", "Console", "Score", "reduced"]
+    dtypes = [object, np.int32, np.int32, np.float64, object]
+
+    def __init__(self, data, categories):
+        self.categories = categories  # Column -> Categories, for Status and Console
+        size = data.shape[0]
+        capacity = max(16, size)
+        self._arrays = {}
+        for column, dtype in zip(self.stored, self.dtypes):
+            self._arrays[column] = np.empty(capacity, dtype=dtype)
+            self._arrays[column][:size] = self.encode(column, data[column].values)
+        self._alive = np.zeros(capacity, dtype=bool)
+        self._alive[:size] = True
+        self.size = size  # The number of ids used so far, the next row gets this id
+        self.count = size  # The number of games
+        for column, categories in self.categories.items():
+            categories.counts += np.bincount(self._arrays[column][:size], minlength=len(categories.counts))
+        self.statistics = Statistics()
+        self.addStatistics(np.arange(size))
+
+    def encode(self, column, values):
+        if column in self.categories:
+            return self.categories[column].encode(values)
+        return values
+
+    def reserve(self, size):
+        # Make room for ids up to size, arrays at least double in size when they are full
+        if size <= len(self._alive):
+            return
+        capacity = max(2 * len(self._alive), size)
+        for column in self.stored:
+            self._arrays[column] = np.resize(self._arrays[column], capacity)
+        self._alive = np.resize(self._alive, capacity)
+        self._alive[self.size:] = False
+
+    def append(self, row):
+        # Add a row (a value per column, categorized is ignored) and return its id
+        self.reserve(self.size + 1)
+        id = self.size
+        for column, value in zip(self.stored, row):
+            if column in self.categories:
+                value = self.categories[column].add(value)
+                self.categories[column].counts[value] += 1
+            self._arrays[column][id] = value
+        self._alive[id] = True
+        self.size += 1
+        self.count += 1
+        self.addStatistics(id)
+        return id
+
+    def extend(self, data):
+        # Add the rows of a DataFrame at once and return their ids
+        ids = np.arange(self.size, self.size + data.shape[0])
+        self.reserve(self.size + ids.size)
+        for column in self.stored:
+            self._arrays[column][ids] = self.encode(column, data[column].values)
+        self._alive[ids] = True
+        self.size += ids.size
+        self.count += ids.size
+        for column, categories in self.categories.items():
+            categories.counts += np.bincount(self._arrays[column][ids], minlength=len(categories.counts))
+        self.addStatistics(ids)
+        return ids
+
+    def delete(self, id):
+        self._alive[id] = False
+        self.count -= 1
+        self.addStatistics(id, -1)
+        for column, categories in self.categories.items():
+            categories.counts[self._arrays[column][id]] -= 1
+
+    def assign(self, ids, column, value):
+        # Give several rows the same value in a column
+        counted = column in ("Status", "Console", "Score")
+        if counted:
+            self.addStatistics(ids, -1)
+        if column in self.categories:
+            categories = self.categories[column]
+            categories.counts -= np.bincount(self._arrays[column][ids], minlength=len(categories.counts))
+            value = categories.add(value)
+            categories.counts[value] += len(ids)
+        self._arrays[column][ids] = value
+        if counted:
+            self.addStatistics(ids)
+
+    def addStatistics(self, ids, count=1):
+        # Count (or with count=-1 stop counting) the rows in statistics
+        self.statistics.add(self._arrays["Status"][ids], self._arrays["Console"][ids],
+                            self._arrays["Score"][ids], count)
+
+    def statisticsOf(self, ids):
+        # The same statistics for only some of the rows, like the ones shown by a search
+        statistics = Statistics()
+        statistics.add(self._arrays["Status"][ids], self._arrays["Console"][ids], self._arrays["Score"][ids])
+        return statistics
+
+    def ids(self):
+        return np.flatnonzero(self._alive[:self.size])
+
+    def get(self, ids, column):
+        # The values of a column for an id or an array of ids
+        if column == "categorized":
+            return self.ranks(ids, "Status")
+        if column in self.categories:
+            return self.categories[column].decode(self._arrays[column][ids])
+        return self._arrays[column][ids]
+
+    def ranks(self, ids, column):
+        # The sorting position of the Status or Console values of the ids
+        return self.categories[column].ranks[self._arrays[column][ids]]
+
+    def column(self, column):
+        # The values of every id, including deleted rows. Changing the result changes the store
+        return self._arrays[column][:self.size]
+
+    def frame(self, ids):
+        # A copy of the rows as a DataFrame, in the order of the given ids.
+        # pandas is only imported here, it isn't needed until the games are saved
+        import pandas as pd
+        return pd.DataFrame({column: self.get(ids, column) for column in self.columns})
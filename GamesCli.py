@@ -0,0 +1,187 @@
+import sys
+import os
+import json
+import argparse
+from GameLibrary import GameLibrary, default_storage, prepare_data
+from FileWriter import FileWriter
+from Storage import open_storage
+
+
+# The games list from the command line, for scripts and scheduled jobs. It uses the same
+# files as the program (run it while the program isn't running) but never imports Qt, e.g.
+#   python GamesCli.py search "zelda" --sort score --descending
+#   python GamesCli.py add "Celeste" "To do" PC
+#   python GamesCli.py edit "Celeste" --status Done --score 9.5
+# Games are printed one per line with their number, title, status, console and score
+# separated by tabs. Errors are printed to stderr and the exit code is 1
+
+COLUMNS = {"title": 0, "status": 1, "console": 2, "score": 3}
+
+
+class CommandError(Exception):
+    pass
+
+
+def read_list(fileName):
+    if not os.path.exists(fileName):
+        raise CommandError("There is no " + fileName + " in " + os.getcwd() + ", start the program there first.")
+    return [c[:-1] for c in open(fileName).readlines()]
+
+
+def open_games(kind):
+    # The games of the storage, changes are written right away instead of by a save worker
+    status = read_list("Status.txt")
+    consoles = read_list("Consoles.txt")
+    if kind == "csv" and not os.path.exists("Games.txt"):
+        raise CommandError("There is no Games.txt in " + os.getcwd() + ", start the program there first.")
+    status_dict = dict(zip(status, range(len(status))))
+    storage = open_storage(kind, FileWriter(), lambda data: prepare_data(data, status_dict))
+    return GameLibrary(prepare_data(storage.load()), status, consoles, storage), consoles
+
+
+def score_text(score):
+    # Scores as they are chosen in the program, -1 is no score
+    return "No score" if score == -1 else str(float(score))
+
+
+def check_game(games, consoles, status, console, score):
+    if status not in games.statuses():
+        raise CommandError("Unknown status \"" + status + "\", use one of: " + ", ".join(games.statuses()))
+    if console not in consoles:
+        raise CommandError("Unknown console \"" + console + "\", use one of: " + ", ".join(consoles))
+    if score != "No score":
+        try:
+            value = float(score)
+        except ValueError:
+            value = -1
+        if not (0 <= value <= 10 and value * 2 % 1 == 0):
+            raise CommandError("Scores are 0 to 10 in steps of 0.5, or \"No score\".")
+
+
+def find_game(games, title):
+    id = games.find(title)
+    if id is None:
+        raise CommandError("\"" + title + "\" is not in the list.")
+    return id
+
+
+def print_games(games, ids):
+    store = games.store
+    rows = zip(games.rowNumbers(ids), store.get(ids, "Title"), store.get(ids, "Status"),
+               store.get(ids, "Console"), store.get(ids, "Score"))
+    for number, title, status, console, score in rows:
+        print(number, title, status, console, "" if score == -1 else str(score), sep="\t")
+
+
+def list_games(games, consoles, args):
+    print_games(games, games.findOrder(getattr(args, "text", ""), COLUMNS[args.sort], int(args.descending)))
+
+
+def add_game(games, consoles, args):
+    check_game(games, consoles, args.status, args.console, args.score)
+    return games.addGame([args.title, args.status, args.console, args.score])
+
+
+def edit_game(games, consoles, args):
+    id = find_game(games, args.title)
+    value = [args.new_title or args.title,
+             args.status or games.store.get(id, "Status"),
+             args.console or games.store.get(id, "Console"),
+             args.score or score_text(games.store.get(id, "Score"))]
+    check_game(games, consoles, *value[1:])
+    return games.updateGame(id, value)
+
+
+def delete_game(games, consoles, args):
+    return games.deleteGame(find_game(games, args.title))
+
+
+def import_games(games, consoles, args):
+    try:
+        added, rejected = games.importGames(args.file, consoles)
+    except (OSError, ValueError) as error:
+        return "Could not import " + args.file + ":\n" + str(error)
+    for line, title, reason in rejected:
+        print(str(line) + ": " + title + " (" + reason + ")", file=sys.stderr)
+    print(str(added) + " games were added, " + str(len(rejected)) + " were not.")
+    return ""
+
+
+def export_games(games, consoles, args):
+    # The games in the saved order, as a file that can be imported again
+    data = games.snapshot()[["Title", "Status", "Console", "Score"]]
+    try:
+        if args.file.lower().endswith(".json"):
+            data.to_json(args.file, orient="records", indent=2)
+        else:
+            data.to_csv(args.file, sep="$" if args.file.lower().endswith(".txt") else ",", index=False)
+    except OSError as error:
+        return "Could not export " + args.file + ":\n" + str(error)
+    return ""
+
+
+def show_stats(games, consoles, args):
+    # The counts are kept up to date by the games, only a search has to count its result
+    ids = None if args.text is None else games.findOrder(args.text, 1, 0)
+    print(json.dumps(games.statistics(ids), indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Use the games list without opening the program")
+    parser.add_argument("--storage", choices=["csv", "binary", "sqlite"],
+                        help="Where the games are kept, like for GamesList.py")
+    parser.add_argument("--directory", default=".", help="The folder with the games list (default: the current one)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    for name, function, help in [("list", list_games, "Print every game"),
+                                 ("search", list_games, "Print the games whose title contains a text")]:
+        command = commands.add_parser(name, help=help)
+        if name == "search":
+            command.add_argument("text")
+        command.add_argument("--sort", choices=list(COLUMNS), default="status")
+        command.add_argument("--descending", action="store_true")
+        command.set_defaults(function=function)
+
+    command = commands.add_parser("add", help="Add a game")
+    command.add_argument("title")
+    command.add_argument("status")
+    command.add_argument("console")
+    command.add_argument("--score", default="No score")
+    command.set_defaults(function=add_game)
+
+    command = commands.add_parser("edit", help="Change a game, only the given fields are changed")
+    command.add_argument("title")
+    command.add_argument("--title", dest="new_title")
+    command.add_argument("--status")
+    command.add_argument("--console")
+    command.add_argument("--score", help="0 to 10 in steps of 0.5, or \"No score\"")
+    command.set_defaults(function=edit_game)
+
+    command = commands.add_parser("delete", help="Delete a game")
+    command.add_argument("title")
+    command.set_defaults(function=delete_game)
+
+    command = commands.add_parser("import", help="Add the games of a CSV or JSON file")
+    command.add_argument("file")
+    command.set_defaults(function=import_games)
+
+    command = commands.add_parser("export", help="Write the games to a CSV (.csv, .txt) or JSON (.json) file")
+    command.add_argument("file")
+    command.set_defaults(function=export_games)
+
+    command = commands.add_parser("stats", help="Print the number of games and their scores per status and console")
+    command.add_argument("text", nargs="?", help="Only count the games found by this search")
+    command.set_defaults(function=show_stats)
+
+    args = parser.parse_args()
+    os.chdir(args.directory)
+    try:
+        # Changes are journaled like in the program, which folds them into the games file.
+        # The journal isn't folded in here, so a command never has to rewrite the whole list
+        games, consoles = open_games(args.storage or default_storage())
+        error = args.function(games, consoles, args)
+    except (CommandError, OSError, ValueError) as exception:
+        error = str(exception)
+    if error:
+        print(error, file=sys.stderr)
+        sys.exit(1)
@@ -1,145 +1,172 @@
 import sys
 import os
+import argparse
+from collections import OrderedDict
 from PyQt5 import QtCore, QtWidgets
 from PyQt5.QtCore import Qt, QModelIndex
-from PyQt5.QtWidgets import QApplication, QMainWindow, QMessageBox
-import pandas as pd
+from PyQt5.QtWidgets import QApplication, QMainWindow, QMessageBox, QFileDialog
+import numpy as np
+from GameStore import GameStore
+from GameLibrary import GameLibrary, default_storage, prepare_data
+from SaveWorker import SaveWorker
+from SearchWorker import SearchWorker
+from FileWriter import write_lines
+from Profiler import Profiler
 from MainWindow import Ui_MainWindow
-from AddGameDialog import Ui_Dialog as addGameDialog
-from EditGameDialog import Ui_Dialog as editGameDialog
-from EditConsolesDialog import Ui_Dialog as editConsolesDialog
+# pandas (used by Storage and Importer) and the dialogs are imported when they are first
+# needed, so the main window can be shown before they are loaded
 
 
-def reduce_title(t):
-    # Words that are commonly disregarded from sorting
-    excl = ["a", "by", "in", "of", "the"]
-    t_list = t.lower().split(" ")
-    return " ".join(list(filter(lambda a:a not in excl, t_list)))
-    
-
 class TableModel(QtCore.QAbstractTableModel):
+    # Shows the games of a GameLibrary in the tableView, filtered and sorted
     
-    def __init__(self, fileName, data, status_dict):
+    searching = QtCore.pyqtSignal(bool)  # Whether a search is running on the search worker
+    changed = QtCore.pyqtSignal()  # The games or the rows shown changed
+    
+    def __init__(self, data, status, consoles, storage):
         super(TableModel, self).__init__()
-        self.fileName = fileName
-        self._backend_data = data  # The data that is imported/exported/edited
-        self._data = data  # The representation of the data after applying sorting (used by tableView)
-        self.status_dict = status_dict
+        self.games = GameLibrary(data, status, consoles, storage)
         self.current_filter = ""
         self.sort_column = 1
         self.sort_order = 0  # 0 = ascending, 1 = descending
+        
+        # The ids of the rows shown after filtering and sorting (used by tableView)
+        self._order = self.games.findOrder(self.current_filter, self.sort_column, self.sort_order)
+        self._changed = False  # Whether the games have changed since _order was found
+        
+        # Rows are only turned into display strings when the tableView gets to them, a chunk at a time
+        self.chunk_size = 500
+        self._display = [[] for column in GameStore.columns]  # Display strings of the fetched rows, one list per column
+        self._row_numbers = []  # Row numbers of the fetched rows, None until the vertical header shows them
+        self.fetchRows(min(self.chunk_size, len(self._order)))
+        
+        # Search texts are filtered on a separate thread (see search). Everything else uses the
+        # games on this thread, after stopping the search worker (see finishSearch)
+        self.searchWorker = SearchWorker(self.games)
+        self.searchWorker.found.connect(self.showSearch)
+        self.searchWorker.start()
+        self._search = None  # (request number, text) of the search running on the worker
     
     def data(self, index, role):
         if role == Qt.DisplayRole:
-            
-            value = self._data.iloc[index.row()][index.column()]
-            if value == -1:  # Display a score of -1 (no score) as an empty string
-                value = ""
-            return str(value)
+            return self._display[index.column()][index.row()]
     
     def rowCount(self, index):
-        return self._data.shape[0]
+        if index.isValid():  # Rows have no children
+            return 0
+        return len(self._row_numbers)
     
     def columnCount(self, index):
-        return self._data.shape[1]
+        if index.isValid():
+            return 0
+        return len(GameStore.columns)
+    
+    def canFetchMore(self, index):
+        if index.isValid():
+            return False
+        return len(self._row_numbers) < len(self._order)
+    
+    def fetchMore(self, index):
+        fetched = len(self._row_numbers)
+        count = min(self.chunk_size, len(self._order) - fetched)
+        self.beginInsertRows(QModelIndex(), fetched, fetched + count - 1)
+        self.fetchRows(count)
+        self.endInsertRows()
+    
+    def fetchRows(self, count):
+        # Add the display strings of the next rows in _order
+        fetched = len(self._row_numbers)
+        ids = self._order[fetched:fetched+count]
+        for column, strings in zip(self._display, self.buildDisplay(ids)):
+            column.extend(strings)
+        self._row_numbers.extend([None] * len(ids))
     
     def headerData(self, section, orientation, role):
         if role ==  Qt.DisplayRole:
             if orientation == Qt.Horizontal:
-                return self._data.columns[section]
+                return GameStore.columns[section]
             if orientation == Qt.Vertical:
-                return str(self._data.index[section] + 1)  # 1-indexed for normies
+                if self._row_numbers[section] is None:
+                    self._row_numbers[section] = self.games.rowNumbers(self._order[section:section+1])[0]
+                return self._row_numbers[section]
+    
+    def buildDisplay(self, ids):
+        # Convert every column to strings once, instead of on every repaint
+        display = []
+        for column in GameStore.columns:
+            values = self.games.store.get(ids, column)
+            if column == "Score":  # Display a score of -1 (no score) as an empty string
+                display.append(["" if value == -1 else str(value) for value in values])
+            else:
+                display.append([str(value) for value in values])
+        return display
+    
+    def rowId(self, index):
+        # Convert tableView index to the id of the game, None for no index
+        return None if index is None else self._order[index.row()]
+    
+    def validateTitle(self, title, id=None):
+        # When editing a game, id is that game and its own title is allowed
+        return self.games.validateTitle(title, id)
+    
+    def similarTitles(self, title, id=None):
+        return self.games.similarTitles(title, id)
     
     # Adding a row
     def setData(self, index, value, role):
         if role == Qt.EditRole:
-            
-            # Check validity of title
-            if value[0] in self._backend_data["Title"].values:
-                return "\"" + value[0] + "\" already exists."
-            if value[0].strip() == "":
-                return "Enter a title."
-            if "$" in value[0]:
-                return "The symbol \"$\" is reserved."
-            
-            # Convert selected score to a float
-            if value[3] == "No score":
-                value[3] = -1
-            value[3] = float(value[3])
-            
-            # Add hidden representations of title and status (used for sorting)
-            value.append(reduce_title(value[0]))
-            value.append(self.status_dict[value[1]])
-            
-            # Make a new row and find the row that comes before the new row
-            row = pd.DataFrame([value], columns=self._backend_data.columns)
-            before1 = self._backend_data["categorized"] < value[5]
-            before2 = (self._backend_data["categorized"] == value[5]) & \
-                      (self._backend_data["reduced"] <= value[4])
-            temp = self._backend_data[before1 | before2]
-            
-            # Sandwich the new row in between the rows that come before (if any) and after
-            if temp.empty:
-                self._backend_data = pd.concat([row, self._backend_data]).reset_index(drop=True)
-            else:
-                idx = temp.index[-1] + 1
-                self._backend_data = pd.concat([self._backend_data.iloc[:idx], row, 
-                                                self._backend_data.iloc[idx:]]).reset_index(drop=True)
-            
-            # Update the tableView (maintain current sorting)
-            self.filterSortData()
-            
-            # Save the data
-            self._backend_data.to_csv(self.fileName, sep="$", header=True, index=False)
-            
-            return ""
+            self.finishSearch()
+            error = self.games.addGame(value)
+            if error == "":
+                self.changeRow(added=self.games.find(value[0]))
+            return error
         return "Something went wrong."
     
+    # The rows are turned into ids first, finishing a running search changes the rows shown
     def updateData(self, index, value, role):
         if role == Qt.EditRole:
-            
-            # Convert tableView index to _backend_data index
-            row = self._data.index[index.row()]
-            
-            # Check that title doesn't already exist among the other objects
-            # Special case for first item
-            if row == 0:
-                if value[0] in self._backend_data.Title.values[row+1:]:
-                    return "\"" + value[0] + "\" already exists."
-            # General case
-            elif (value[0] in self._backend_data.Title.values[:row-1]) | \
-                (value[0] in self._backend_data.Title.values[row+1:]):
-                return "\"" + value[0] + "\" already exists."
-            if value[0].strip() == "":
-                return "Enter a title."
-            if "$" in value[0]:
-                return "The symbol \"$\" is reserved."
-            
-            # Delete the row, then insert the updated row
-            self._backend_data = self._backend_data.drop(row, axis=0)
-            return self.setData(QModelIndex(), value, role)
-        
+            return self.updateGame(self.rowId(index), value)
         return "Something went wrong."
     
     def deleteData(self, index, role):
         if role == Qt.EditRole:
-            
-            # Convert tableView index to _backend_data index
-            row = self._data.index[index.row()]
-            
-            # Delete the row and update the tableView (maintain current sorting)
-            self._backend_data = self._backend_data.drop(row, axis=0).reset_index(drop=True)
-            self.filterSortData()
-            
-            # Save the data
-            self._backend_data.to_csv(self.fileName, sep="$", header=True, index=False)
-            
-            return ""
-        
+            return self.deleteGame(self.rowId(index))
         return "Something went wrong"
     
+    def editRows(self, rows, changes):
+        # Give several rows (in the tableView) the same status, console and/or score at once
+        self.editGames(self._order[rows], changes)
+    
+    def updateGame(self, id, value):
+        self.finishSearch()
+        error = self.games.updateGame(id, value)
+        if error == "":
+            self.changeRow(removed=id, added=self.games.find(value[0]))
+        return error
+    
+    def deleteGame(self, id):
+        self.finishSearch()
+        error = self.games.deleteGame(id)
+        if error == "":
+            self.changeRow(removed=id)
+        return error
+    
+    def editGames(self, ids, changes):
+        self.finishSearch()
+        self.games.editGames(ids, changes)
+        self.refresh()
+    
+    def refresh(self):
+        # Update the tableView after the games changed (maintain current sorting)
+        self._changed = True
+        self.filterSortData()
+    
     def filterSortData(self, text=None, column=-1, order=-1):
-        # If an argument is unspecified, use the current choice
+        # If an argument is unspecified, use the current choice (or the text still being searched)
+        if self._search is not None:
+            searched = self.cancelSearch()
+            if text is None:
+                text = searched
         if text == None:
             text = self.current_filter
         if column == -1:
@@ -151,76 +178,308 @@ class TableModel(QtCore.QAbstractTableModel):
         self.sort_column = column
         self.sort_order = order
         
-        ascending = (order == 0)
-        by = ""
-        
-        # If column != 0, the rows are sorted secondarily by reduced title (always ascending)
-        if column == 0: 
-            by = 'reduced'
-        elif column == 1:
-            by = ['categorized', 'reduced']
-            ascending = [ascending, True]
-        elif column == 2:
-            by = ['Console', 'reduced']
-            ascending = [ascending, True]
-        elif column == 3:
-            by = ['Score', 'reduced']
-            ascending = [ascending, True]
-        
-        # Declare that the displayed data is about to change, then do it
+        self.showOrder(self.games.findOrder(text, column, order))
+    
+    def showOrder(self, order):
+        # Nothing to redraw if the same rows are shown in the same order
+        if not self._changed and np.array_equal(order, self._order):
+            return
+        
+        # Declare that the displayed data is about to change, then do it.
+        # Only the first chunk is displayed right away, the rest is fetched when scrolled to
         self.beginResetModel()
-        temp = self._backend_data[self._backend_data['Title'].str.lower().str.contains(text.lower())]
-        temp = temp.sort_values(by=by, ascending=ascending)
-        self._data = temp
+        self._order = order
+        self._display = [[] for column in GameStore.columns]
+        self._row_numbers = []
+        self.fetchRows(min(self.chunk_size, len(order)))
+        self._changed = False
         self.endResetModel()
+        self.changed.emit()
+    
+    def search(self, text):
+        # Filter by the text on the search worker, the rows are replaced once it is done.
+        # A search that is still running is cancelled
+        if self._search is None and text == self.current_filter:
+            return
+        self._search = (self.searchWorker.search(text, self.sort_column, self.sort_order), text)
+        self.searching.emit(True)
+    
+    def showSearch(self, number, order):
+        # Results of a search that was cancelled or replaced by another one are ignored.
+        # A dialog that is open may be editing the selected games, so they are shown once it is closed
+        if self._search is None or self._search[0] != number:
+            return
+        if QApplication.activeModalWidget() is not None:
+            QtCore.QTimer.singleShot(100, lambda: self.showSearch(number, order))
+            return
+        self.current_filter = self._search[1]
+        self._search = None
+        self.searching.emit(False)
+        self.showOrder(order)
+    
+    def cancelSearch(self):
+        # Stop the search worker, returns the text it was searching (None if it wasn't)
+        if self._search is None:
+            return None
+        self.searchWorker.cancel()
+        text = self._search[1]
+        self._search = None
+        self.searching.emit(False)
+        return text
+    
+    def finishSearch(self):
+        # Stop the search worker before using the games on this thread. The search it was
+        # running is done here instead, so changes apply to the rows the user is looking for
+        text = self.cancelSearch()
+        if text is not None:
+            self.filterSortData(text=text)
+    
+    def importGames(self, fileName, consoles):
+        self.finishSearch()
+        added, rejected = self.games.importGames(fileName, consoles)
+        if added:
+            self.refresh()
+        return added, rejected
+    
+    def reload(self, data):
+        # Show the games of data instead, e.g. after another program changed the games file
+        self.finishSearch()
+        added, removed, changed = self.games.reload(data)
+        if added or removed or changed:
+            self.refresh()
+        return added, removed, changed
+    
+    def changeRow(self, removed=None, added=None):
+        # Update the tableView after a single row was removed and/or added (maintain current
+        # sorting) without resetting it, so the other rows, the selection and the scroll
+        # position are kept. An updated row is removed under its old id and added under its new one.
+        # The rows shown are patched instead of found again, the added row goes where the sorted
+        # order has it if it matches the search
+        order = self._order
+        fetched = len(self._row_numbers)
+        complete = fetched == len(self._order)
+        
+        # Only rows that are fetched (or would be, for the added row) have to be announced
+        old_pos = new_pos = None
+        if removed is not None:
+            pos = np.flatnonzero(order == removed)
+            if len(pos):
+                order = np.delete(order, pos[0])
+                if pos[0] < fetched:
+                    old_pos = pos[0]
+                    fetched -= 1
+        if added is not None:
+            pos = self.games.insertPosition(order, added, self.current_filter, self.sort_column, self.sort_order)
+            if pos is not None:
+                order = np.insert(order, pos, added)
+                if complete or pos < fetched:
+                    new_pos = pos
+                    display = self.buildDisplay([added])
+        
+        if old_pos is not None and new_pos is not None:
+            if old_pos != new_pos:
+                # Qt expects the destination as the row the moved row goes in front of, before the move
+                self.beginMoveRows(QModelIndex(), old_pos, old_pos, QModelIndex(),
+                                   new_pos + 1 if new_pos > old_pos else new_pos)
+            for column, strings in zip(self._display, display):
+                del column[old_pos]
+                column.insert(new_pos, strings[0])
+            self._order = order
+            if old_pos != new_pos:
+                self.endMoveRows()
+            self.dataChanged.emit(self.index(new_pos, 0), self.index(new_pos, len(self._display) - 1))
+        elif old_pos is not None:
+            self.beginRemoveRows(QModelIndex(), old_pos, old_pos)
+            for column in self._display:
+                del column[old_pos]
+            del self._row_numbers[old_pos]
+            self._order = order
+            self.endRemoveRows()
+        elif new_pos is not None:
+            self.beginInsertRows(QModelIndex(), new_pos, new_pos)
+            for column, strings in zip(self._display, display):
+                column.insert(new_pos, strings[0])
+            self._row_numbers.insert(new_pos, None)
+            self._order = order
+            self.endInsertRows()
+        self._order = order
+        
+        # The rows after the changed row in the saved order are numbered differently now,
+        # they are numbered again once they are shown
+        self._row_numbers = [None] * len(self._row_numbers)
+        if self._row_numbers:
+            self.headerDataChanged.emit(Qt.Vertical, 0, len(self._row_numbers) - 1)
+        self.changed.emit()
     
     def isConsoleUsed(self, console):
-        return console in self._backend_data["Console"].values
+        return self.games.isConsoleUsed(console)
+    
+    def addConsole(self, console):
+        self.finishSearch()
+        if self.games.addConsole(console):
+            self.refresh()
     
     def renameConsole(self, old, new):
-        # Replace the old console with the new
-        self._backend_data["Console"] = self._backend_data["Console"].replace({old:new})
-        
-        # Update the tableView
-        self.filterSortData()
-            
-        # Save the data
-        self._backend_data.to_csv(self.fileName, sep="$", header=True, index=False)
+        self.finishSearch()
+        self.games.renameConsole(old, new)
+        self.refresh()
+    
+    def isStatusUsed(self, status):
+        return self.games.isStatusUsed(status)
+    
+    def statuses(self):
+        return self.games.statuses()
+    
+    def setStatuses(self, statuses, renamed):
+        self.finishSearch()
+        self.games.setStatuses(statuses, renamed)
+        self.refresh()
+    
+    def statistics(self, shown=False):
+        # The statistics of every game, or of the rows shown in the tableView
+        self.finishSearch()
+        return self.games.statistics(self._order if shown else None)
+    
+    def snapshot(self):
+        self.finishSearch()
+        return self.games.snapshot()
+    
+    def close(self):
+        self.cancelSearch()
+        self.searchWorker.stop()
+        self.games.close()
         
 
+class OpenList():
+    # A games list the window can show: a directory with its own games (Games.txt, Games.bin or
+    # Games.db), Status.txt and Consoles.txt. The games are loaded when the list is first shown,
+    # and unloaded again when lists shown more recently need the memory (see GamesList.evictLists)
+    
+    def __init__(self, directory, storage=None):
+        self.directory = os.path.abspath(directory)
+        self.name = os.path.basename(self.directory) or self.directory
+        self.storageKind = storage or default_storage(self.directory)
+        self.status = None  # Read when the games are loaded
+        self.consoles = None
+        self.storage = None
+        self.tableModel = None  # None while the games aren't loaded
+    
+    def path(self, fileName):
+        return os.path.join(self.directory, fileName)
+
+
 class GamesList(QMainWindow):
     
-    def __init__(self):
+    def __init__(self, storage=None, profiler=None, directories=None, memory=512):
+        # storage is the kind of storage of every list (by default the one each list has),
+        # directories are the lists that can be shown (by default the current directory)
+        # and memory is the budget in MB for keeping lists loaded
         super().__init__()
+        
+        # Measures the hot paths if it is enabled (see Profiler.py)
+        self.profiler = profiler or Profiler()
 
         # Setup main window
-        self.ui = Ui_MainWindow()
-        self.ui.setupUi(self)
+        with self.profiler.timer("startup.window"):
+            self.ui = Ui_MainWindow()
+            self.ui.setupUi(self)
         self.setWindowTitle('Games List')
         
-        # Get data
-        self.fileName = "Games.txt"
-        if not os.path.exists("Games.txt"):
-            self.generateGamesFile()
-        data = pd.read_csv(self.fileName, sep = "$")
-        if not os.path.exists("Status.txt"):
-            self.generateStatusFile()
-        self.status = [c[:-1] for c in open("Status.txt").readlines()]
-        status_dict = dict(zip(self.status, list(range(len(self.status)))))
-        if not os.path.exists("Consoles.txt"):
-            self.generateConsolesFile()
-        self.consoles = [c[:-1] for c in open("Consoles.txt").readlines()]
+        # Files are written in the background, errors are shown when they happen
+        self.saveWorker = SaveWorker()
+        self.saveWorker.failed.connect(self.saveFailed)
+        self.profiler.instrument(self.saveWorker, "write", "write file")
+        self.saveWorker.start()
+        
+        # The lists that can be shown. The attributes of the list that is shown (status,
+        # consoles, storageKind, storage and tableModel) are kept on the window (see useList).
+        # Loaded lists stay loaded while they fit in the memory budget, most recently shown last
+        self.lists = []
+        self.loaded = OrderedDict()  # Directory -> OpenList
+        self.memoryBudget = memory * 1024 * 1024
+        self.fileWatcher = None
+        for directory in directories or ["."]:
+            self.addList(directory, storage)
+        self.useList(self.lists[0])
         self.scores = ["No score","10.0","9.5","9.0","8.5",
                        "8.0","7.5","7.0","6.5","6.0","5.5",
                        "5.0","4.5","4.0","3.5","3.0","2.5",
                        "2.0","1.5","1.0","0.5","0.0"]
         
-        # Create hidden representations of title and status (used for sorting)
-        data["reduced"] = data["Title"].apply(reduce_title)
-        data["categorized"] = data["Status"].replace(status_dict)
+        # Nothing can be used until the games are loaded (see loadGames)
+        self.ui.centralwidget.setEnabled(False)
+        self.ui.menubar.setEnabled(False)
+        
+        # Define button behaviour
+        self.ui.button_add.clicked.connect(self.openAddDialog)
+        self.ui.button_edit.clicked.connect(self.openEditDialog)
+        self.ui.button_consoles.clicked.connect(self.openConsoleDialog)
+        self.ui.button_statuses.clicked.connect(self.openStatusDialog)
+        self.ui.button_statistics.clicked.connect(self.openStatisticsDialog)
+        self.ui.button_clear.clicked.connect(self.clearSearch)
+        self.ui.comboBox_lists.currentIndexChanged.connect(self.showList)
+        self.ui.tableView.horizontalHeader().sortIndicatorChanged.connect(self.headerTriggered)
+        
+        # Search bar. The search starts once typing pauses, "Searching..." is shown if it takes a while
+        self.ui.lineEdit_search.textChanged.connect(self.applyFilter)
+        self.searchTimer = QtCore.QTimer(self)
+        self.searchTimer.setSingleShot(True)
+        self.searchTimer.setInterval(150)
+        self.searchTimer.timeout.connect(self.startSearch)
+        self.slowSearchTimer = QtCore.QTimer(self)
+        self.slowSearchTimer.setSingleShot(True)
+        self.slowSearchTimer.setInterval(300)
+        self.slowSearchTimer.timeout.connect(lambda: self.ui.label_searching.setText("Searching..."))
+        
+        # Menu
+        self.ui.actionOpenList.triggered.connect(self.chooseList)
+        self.ui.actionImport.triggered.connect(self.importGames)
+        self.ui.actionPerformance.triggered.connect(self.openPerformanceDialog)
+        self.ui.menuDebug.menuAction().setVisible(self.profiler.enabled)
+        self.performanceDialog = None
+        self.statisticsDialog = None
+    
+    
+    def loadGames(self):
+        # Read the games of the list that is shown and show them. This is the slow part of
+        # starting the program, so it is done after the window is shown
+        if self.storageKind == "csv" and not os.path.exists(self.list.path("Games.txt")):
+            self.generateGamesFile()
+        if not os.path.exists(self.list.path("Status.txt")):
+            self.generateStatusFile()
+        self.status = [c[:-1] for c in open(self.list.path("Status.txt")).readlines()]
+        if not os.path.exists(self.list.path("Consoles.txt")):
+            self.generateConsolesFile()
+        self.consoles = [c[:-1] for c in open(self.list.path("Consoles.txt")).readlines()]
+        
+        with self.profiler.timer("startup.open"):
+            from Storage import open_storage
+            status_dict = dict(zip(self.status, list(range(len(self.status)))))
+            self.storage = open_storage(self.storageKind, self.saveWorker, lambda data: prepare_data(data, status_dict),
+                                        self.list.directory)
+        with self.profiler.timer("startup.load"):
+            data = self.storage.load()
+        with self.profiler.timer("startup.prepare"):
+            data = prepare_data(data)
         
         # Set up QTableView
-        self.tableModel = TableModel(self.fileName, data, status_dict)
+        with self.profiler.timer("startup.model"):
+            self.tableModel = TableModel(data, self.status, self.consoles, self.storage)
+        for method in ["data", "filterSortData", "showSearch", "setData", "updateGame", "deleteGame",
+                       "editGames", "importGames", "reload", "renameConsole", "setStatuses"]:
+            self.profiler.instrument(self.tableModel, method)
+        self.profiler.instrument(self.tableModel.games, "save")
+        self.tableModel.searching.connect(self.searchingChanged)
+        self.tableModel.changed.connect(self.showStatistics)
+        self.keepList()
+        self.loaded[self.list.directory] = self.list
+        self.showGames()
+        
+        self.ui.centralwidget.setEnabled(True)
+        self.ui.menubar.setEnabled(True)
+    
+    def showGames(self):
+        # Set up the tableView for the model of the list, sorted and searched like it was
         self.ui.tableView.setModel(self.tableModel)
         self.ui.tableView.setColumnWidth(0, 327)
         self.ui.tableView.setColumnWidth(1, 95)
@@ -232,35 +491,133 @@ class GamesList(QMainWindow):
         self.ui.tableView.hideColumn(4)
         self.ui.tableView.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOn)
         self.ui.tableView.setSelectionBehavior(1) # Select whole row
-        self.ui.tableView.setSelectionMode(1) # Only one selection at a time
+        self.ui.tableView.setSelectionMode(3) # Select several rows with shift/ctrl
         self.ui.tableView.setSortingEnabled(True)
-        self.ui.tableView.sortByColumn(1, Qt.AscendingOrder)
-        self.ui.tableView.horizontalHeader().sortIndicatorChanged.connect(self.headerTriggered)
-        
-        # Define button behaviour
-        self.ui.button_add.clicked.connect(self.openAddDialog)
-        self.ui.button_edit.clicked.connect(self.openEditDialog)
-        self.ui.button_consoles.clicked.connect(self.openConsoleDialog)
-        self.ui.button_clear.clicked.connect(self.clearSearch)
-        
-        # Search bar
-        self.ui.lineEdit_search.textChanged.connect(self.applyFilter)
+        self.ui.tableView.sortByColumn(self.tableModel.sort_column,
+                                       Qt.DescendingOrder if self.tableModel.sort_order else Qt.AscendingOrder)
+        self.ui.lineEdit_search.blockSignals(True)
+        self.ui.lineEdit_search.setText(self.tableModel.current_filter)
+        self.ui.lineEdit_search.blockSignals(False)
+        self.setWindowTitle("Games List" if len(self.lists) == 1 else "Games List - " + self.list.name)
+        self.watchFiles()
+        self.showStatistics()
+    
+    def closeEvent(self, event):
+        # Write everything that is still pending before quitting. The worker is
+        # stopped first, so the journal is then folded in right away
+        self.saveWorker.flush()
+        self.keepList()
+        for openList in self.loaded.values():
+            openList.tableModel.close()
+        event.accept()
+    
+    def saveFailed(self, fileName, error):
+        message = QMessageBox(text = ("Could not save " + fileName + ":\n" + error))
+        message.setWindowTitle("Error")
+        message.exec()
+    
+    def saveConsoles(self):
+        self.saveWorker.save(self.list.path("Consoles.txt"), write_lines, list(self.consoles))
+    
+    def saveStatuses(self):
+        self.saveWorker.save(self.list.path("Status.txt"), write_lines, list(self.status))
     
     
     # ----- Generation Functions -----
     
     def generateGamesFile(self):
-        file = open('Games.txt', 'w')
+        file = open(self.list.path('Games.txt'), 'w')
         file.write('Title$Status$Console$Score$reduced$categorized')
         
     def generateStatusFile(self):
-        file = open('Status.txt', 'w')
+        file = open(self.list.path('Status.txt'), 'w')
         file.write('Playing\nTo do\nConsider\nDone\nDropped\n')
     
     def generateConsolesFile(self):
-        file = open('Consoles.txt', 'w')
+        file = open(self.list.path('Consoles.txt'), 'w')
         file.write('PC\nMobile\n')        
     
+    
+    # ----- List Functions -----
+    
+    def addList(self, directory, storage=None):
+        # The list in the directory, which is added to the lists that can be shown if it is new
+        for openList in self.lists:
+            if openList.directory == os.path.abspath(directory):
+                return openList
+        openList = OpenList(directory, storage)
+        self.lists.append(openList)
+        self.ui.comboBox_lists.blockSignals(True)
+        self.ui.comboBox_lists.addItem(openList.name)
+        self.ui.comboBox_lists.setItemData(len(self.lists) - 1, openList.directory, Qt.ToolTipRole)
+        self.ui.comboBox_lists.blockSignals(False)
+        return openList
+    
+    def chooseList(self):
+        directory = QFileDialog.getExistingDirectory(self, "Open list", self.list.directory)
+        if directory == "":
+            return
+        openList = self.addList(directory)
+        self.ui.comboBox_lists.setCurrentIndex(self.lists.index(openList))
+    
+    def keepList(self):
+        # Store the attributes of the list that is shown in its OpenList
+        self.list.status = self.status
+        self.list.consoles = self.consoles
+        self.list.storage = self.storage
+        self.list.tableModel = self.tableModel
+    
+    def useList(self, openList):
+        self.list = openList
+        self.status = openList.status
+        self.consoles = openList.consoles
+        self.storageKind = openList.storageKind
+        self.storage = openList.storage
+        self.tableModel = openList.tableModel
+    
+    def showList(self, index):
+        # Show another list. It is loaded the first time, after that it stays loaded (so switching
+        # back is instant) until the memory it takes is needed for lists shown more recently
+        if self.lists[index] is self.list:
+            return
+        self.searchTimer.stop()
+        self.tableModel.finishSearch()
+        self.keepList()
+        self.useList(self.lists[index])
+        if self.tableModel is None:
+            QApplication.setOverrideCursor(Qt.WaitCursor)
+            try:
+                self.loadGames()
+            finally:
+                QApplication.restoreOverrideCursor()
+        else:
+            self.showGames()
+            # Catch up with changes other programs made to the files while the list wasn't shown
+            if self.storageKind == "csv":
+                self.reloadGames()
+            self.reloadConsoles()
+            self.reloadStatuses()
+        self.loaded.move_to_end(self.list.directory)
+        self.evictLists()
+    
+    def evictLists(self):
+        # Unload the lists shown longest ago until the loaded lists fit in the memory budget.
+        # Their changes are saved already, unloading folds the journal into the games file like
+        # closing the program does. The list that is shown is never unloaded
+        self.keepList()
+        memory = {directory: openList.tableModel.games.memory() for directory, openList in self.loaded.items()}
+        total = sum(memory.values())
+        for directory, openList in list(self.loaded.items()):
+            if total <= self.memoryBudget:
+                break
+            if openList is self.list:
+                continue
+            total -= memory[directory]
+            openList.tableModel.close()
+            openList.tableModel = None
+            openList.storage = None
+            del self.loaded[directory]
+    
     # ----- Column Sorting Functions -----
     
     def headerTriggered(self, column=-1, order=-1):
@@ -270,6 +627,7 @@ class GamesList(QMainWindow):
     # ----- Add Dialog Functions -----
 
     def openAddDialog(self):
+        from AddGameDialog import Ui_Dialog as addGameDialog
         self.dialog = QtWidgets.QDialog()
         self.dialog.ui = addGameDialog()
         self.dialog.ui.setupUi(self.dialog)
@@ -280,6 +638,9 @@ class GamesList(QMainWindow):
         self.dialog.ui.button_cancel.clicked.connect(self.dialog.close)
         self.dialog.ui.button_cancel.setAutoDefault(False)
         self.dialog.ui.button_add.setAutoDefault(True)
+        self.dialog.ui.lineEdit_title.textChanged.connect(
+            lambda title: self.titleChanged(title, self.dialog.ui.button_add))
+        self.titleChanged("", self.dialog.ui.button_add)
         self.dialog.exec_()
     
     def addGame(self):
@@ -297,18 +658,39 @@ class GamesList(QMainWindow):
             message.exec()
        
     
+    def titleChanged(self, title, button, id=None):
+        # Check the title while it is typed, the button only works for valid titles
+        error = self.tableModel.validateTitle(title, id)
+        similar = self.tableModel.similarTitles(title, id)
+        button.setEnabled(error == "")
+        if error != "":
+            self.dialog.ui.lineEdit_title.setToolTip(error)
+        elif similar:
+            self.dialog.ui.lineEdit_title.setToolTip("Similar to \"" + similar[0] + "\"")
+        else:
+            self.dialog.ui.lineEdit_title.setToolTip("")
+    
+    
     # ----- Edit Dialog Functions -----
     
     def openEditDialog(self):
         if not self.ui.tableView.selectionModel().hasSelection():
             return
+        if len(self.ui.tableView.selectionModel().selectedRows()) > 1:
+            self.openBulkEditDialog()
+            return
         
         row_elems = self.ui.tableView.selectionModel().selection().indexes()
+        from EditGameDialog import Ui_Dialog as editGameDialog
         self.dialog = QtWidgets.QDialog()
         self.dialog.ui = editGameDialog()
         self.dialog.ui.setupUi(self.dialog)
+        # The game is kept by id, the rows shown can change while the dialog is open
+        self.dialog.id = self.tableModel.rowId(row_elems[0])
         
         # Populate fields
+        self.dialog.ui.lineEdit_title.textChanged.connect(
+            lambda title: self.titleChanged(title, self.dialog.ui.button_update, self.dialog.id))
         self.dialog.ui.lineEdit_title.setText(row_elems[0].data())
         self.dialog.ui.comboBox_status.addItems(self.status)
         self.dialog.ui.comboBox_status.setCurrentText(row_elems[1].data())
@@ -330,9 +712,7 @@ class GamesList(QMainWindow):
         self.dialog.exec_()
     
     def deleteGame(self):
-        row = self.ui.tableView.selectionModel().selection().indexes()[0]
-        
-        result = self.tableModel.deleteData(row, Qt.EditRole)
+        result = self.tableModel.deleteGame(self.dialog.id)
         if result == "":
             self.dialog.close()
         else:
@@ -341,14 +721,12 @@ class GamesList(QMainWindow):
             message.exec()
     
     def updateGame(self):
-        row = self.ui.tableView.selectionModel().selection().indexes()[0]
-        
         title = self.dialog.ui.lineEdit_title.text()
         status = self.dialog.ui.comboBox_status.currentText()
         console = self.dialog.ui.comboBox_console.currentText()
         score = self.dialog.ui.comboBox_score.currentText()
         
-        result = self.tableModel.updateData(row, [title, status, console, score], Qt.EditRole)
+        result = self.tableModel.updateGame(self.dialog.id, [title, status, console, score])
         if result == "":
             self.dialog.close()
         else:
@@ -357,9 +735,49 @@ class GamesList(QMainWindow):
             message.exec()
     
     
+    # ----- Bulk Edit Dialog Functions -----
+    
+    def openBulkEditDialog(self):
+        rows = self.ui.tableView.selectionModel().selectedRows()
+        from BulkEditDialog import Ui_Dialog as bulkEditDialog
+        self.dialog = QtWidgets.QDialog()
+        self.dialog.ui = bulkEditDialog()
+        self.dialog.ui.setupUi(self.dialog)
+        self.dialog.ids = np.array([self.tableModel.rowId(index) for index in rows])
+        
+        # Populate fields, only the fields that are changed from "Unchanged" are applied
+        self.dialog.ui.label_count.setText("Edit " + str(len(rows)) + " games")
+        self.dialog.ui.comboBox_status.addItems(["Unchanged"] + self.status)
+        self.dialog.ui.comboBox_console.addItems(["Unchanged"] + self.consoles)
+        self.dialog.ui.comboBox_score.addItems(["Unchanged"] + self.scores)
+        
+        # Add events
+        self.dialog.ui.button_cancel.clicked.connect(self.dialog.close)
+        self.dialog.ui.button_update.clicked.connect(self.updateGames)
+        
+        # Make the update button the default selected button
+        self.dialog.ui.button_cancel.setAutoDefault(False)
+        self.dialog.ui.button_update.setAutoDefault(True)
+        
+        self.dialog.exec_()
+    
+    def updateGames(self):
+        changes = {}
+        for column, comboBox in [("Status", self.dialog.ui.comboBox_status),
+                                 ("Console", self.dialog.ui.comboBox_console),
+                                 ("Score", self.dialog.ui.comboBox_score)]:
+            if comboBox.currentIndex() != 0:
+                changes[column] = comboBox.currentText()
+        
+        if changes:
+            self.tableModel.editGames(self.dialog.ids, changes)
+        self.dialog.close()
+    
+    
     # ----- Console Dialog Functions -----
     
     def openConsoleDialog(self):
+        from EditConsolesDialog import Ui_Dialog as editConsolesDialog
         self.dialog = QtWidgets.QDialog()
         self.dialog.ui = editConsolesDialog()
         self.dialog.ui.setupUi(self.dialog)
@@ -399,10 +817,7 @@ class GamesList(QMainWindow):
             message.exec()
         else:
             self.consoles.remove(console)
-            with open('Consoles.txt', 'w') as f:
-                for c in self.consoles:
-                    f.write(c)
-                    f.write('\n')
+            self.saveConsoles()
             self.dialog.close()
     
     def updateConsole(self):
@@ -415,35 +830,366 @@ class GamesList(QMainWindow):
                 message.exec()
             else:
                 self.consoles = sorted(self.consoles + [console])
-                with open('Consoles.txt', 'w') as f:
-                    for c in self.consoles:
-                        f.write(c)
-                        f.write('\n')
+                self.tableModel.addConsole(console)
+                self.saveConsoles()
                 self.dialog.close()
+        elif console != self.consoles[index-1] and console in self.consoles:
+            message = QMessageBox(text = (console + " already exists"))
+            message.setWindowTitle("Error")
+            message.exec()
         else:
             self.tableModel.renameConsole(self.consoles[index-1], console)
             self.consoles[index-1] = console
-            with open('Consoles.txt', 'w') as f:
-                for c in self.consoles:
-                    f.write(c)
-                    f.write('\n')
+            self.saveConsoles()
             self.dialog.close()
             
     
     
+    # ----- Status Dialog Functions -----
+    
+    def openStatusDialog(self):
+        from EditStatusesDialog import Ui_Dialog as editStatusesDialog
+        self.dialog = QtWidgets.QDialog()
+        self.dialog.ui = editStatusesDialog()
+        self.dialog.ui.setupUi(self.dialog)
+        
+        # Populate fields. Each item remembers the name it had, so renamed statuses are recognised
+        for status in self.status:
+            self.addStatusItem(status)
+        
+        # Add events
+        self.dialog.ui.button_add.clicked.connect(self.addStatus)
+        self.dialog.ui.button_delete.clicked.connect(self.deleteStatus)
+        self.dialog.ui.button_up.clicked.connect(lambda: self.moveStatus(-1))
+        self.dialog.ui.button_down.clicked.connect(lambda: self.moveStatus(1))
+        self.dialog.ui.button_cancel.clicked.connect(self.dialog.close)
+        self.dialog.ui.button_update.clicked.connect(self.updateStatuses)
+        
+        # Make the update button the default selected button
+        for button in [self.dialog.ui.button_add, self.dialog.ui.button_delete, self.dialog.ui.button_up,
+                       self.dialog.ui.button_down, self.dialog.ui.button_cancel]:
+            button.setAutoDefault(False)
+        self.dialog.ui.button_update.setAutoDefault(True)
+        self.dialog.exec_()
+    
+    def addStatusItem(self, status, original=None):
+        item = QtWidgets.QListWidgetItem(status)
+        item.setFlags(item.flags() | Qt.ItemIsEditable)
+        item.setData(Qt.UserRole, status if original is None else original)
+        self.dialog.ui.listWidget.addItem(item)
+        return item
+    
+    def addStatus(self):
+        item = self.addStatusItem("New status", "")
+        self.dialog.ui.listWidget.setCurrentItem(item)
+        self.dialog.ui.listWidget.editItem(item)
+    
+    def deleteStatus(self):
+        item = self.dialog.ui.listWidget.currentItem()
+        if item is None:
+            return
+        if item.data(Qt.UserRole) != "" and self.tableModel.isStatusUsed(item.data(Qt.UserRole)):
+            message = QMessageBox(text = "The selected status is still\n used by a game entry")
+            message.setWindowTitle("Error")
+            message.exec()
+        else:
+            self.dialog.ui.listWidget.takeItem(self.dialog.ui.listWidget.row(item))
+    
+    def moveStatus(self, step):
+        listWidget = self.dialog.ui.listWidget
+        row = listWidget.currentRow()
+        if row < 0 or not 0 <= row + step < listWidget.count():
+            return
+        listWidget.insertItem(row + step, listWidget.takeItem(row))
+        listWidget.setCurrentRow(row + step)
+    
+    def updateStatuses(self):
+        items = [self.dialog.ui.listWidget.item(row) for row in range(self.dialog.ui.listWidget.count())]
+        statuses = [item.text() for item in items]
+        
+        error = ""
+        if any(status.strip() == "" for status in statuses):
+            error = "Enter a name for every status."
+        elif any("$" in status for status in statuses):
+            error = "The symbol \"$\" is reserved."
+        elif len(set(statuses)) < len(statuses):
+            error = "Every status must have a different name."
+        if error != "":
+            message = QMessageBox(text = error)
+            message.setWindowTitle("Error")
+            message.exec()
+            return
+        
+        renamed = {item.data(Qt.UserRole): item.text() for item in items
+                   if item.data(Qt.UserRole) not in ("", item.text())}
+        self.tableModel.setStatuses(statuses, renamed)
+        self.status = statuses
+        self.saveStatuses()
+        self.dialog.close()
+    
+    
+    # ----- Import Functions -----
+    
+    def importGames(self):
+        fileName, _ = QFileDialog.getOpenFileName(self, "Import games", "",
+                                                  "Game lists (*.csv *.txt *.json *.jsonl);;All files (*)")
+        if fileName == "":
+            return
+        
+        try:
+            added, rejected = self.tableModel.importGames(fileName, self.consoles)
+        except (OSError, ValueError) as error:
+            message = QMessageBox(text = ("Could not import " + fileName + ":\n" + str(error)))
+            message.setWindowTitle("Error")
+            message.exec()
+            return
+        
+        # Every game that wasn't added is listed in the details
+        message = QMessageBox(text = (str(added) + " games were added, " + str(len(rejected)) + " were not."))
+        message.setWindowTitle("Import games")
+        if rejected:
+            message.setDetailedText("\n".join(str(line) + ": " + title + " (" + reason + ")"
+                                              for line, title, reason in rejected))
+        message.exec()
+    
+    
+    # ----- Reload Functions -----
+    
+    def watchFiles(self):
+        # Reload the games, consoles and statuses when another program (or a sync) changes their
+        # files. The binary file and the database are only expected to be changed by the program
+        from FileWatcher import FileWatcher
+        # Only the files of the list that is shown are watched (see showList)
+        if self.fileWatcher is not None:
+            self.fileWatcher.changed.disconnect()
+            self.fileWatcher.deleteLater()
+        fileNames = ["Consoles.txt", "Status.txt"] + (["Games.txt"] if self.storageKind == "csv" else [])
+        self.fileWatcher = FileWatcher([self.list.path(fileName) for fileName in fileNames], parent=self)
+        self.fileWatcher.changed.connect(self.fileChanged)
+    
+    def fileChanged(self, fileName):
+        # A dialog that is open may be editing a game, so the file is reloaded once it is closed
+        if QApplication.activeModalWidget() is not None:
+            self.fileWatcher.retry(fileName)
+            return
+        if os.path.basename(fileName) == "Games.txt":
+            self.reloadGames()
+        elif os.path.basename(fileName) == "Consoles.txt":
+            self.reloadConsoles()
+        else:
+            self.reloadStatuses()
+    
+    def keepChanges(self, text, titles=()):
+        # Ask whether to keep the changes made here, which haven't been saved to a file
+        # that another program changed
+        message = QMessageBox(text = text + "\nKeep the changes made here? Otherwise the file is used as it is.")
+        message.setWindowTitle("File changed")
+        if titles:
+            message.setDetailedText("\n".join(sorted(titles)))
+        message.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
+        return message.exec() == QMessageBox.Yes
+    
+    def reloadGames(self):
+        # Only games that were changed in the file are updated. Changes made here that aren't in
+        # the file yet (see Journal.py) are kept, unless another program changed the same game
+        changes = self.storage.readChanges()
+        if changes is None:
+            return  # Written by the program itself
+        data, known, conflicts = changes
+        theirs = ()
+        if conflicts and not self.keepChanges(str(len(conflicts)) + " games were changed here and in Games.txt "
+                                              "by another program.", conflicts):
+            theirs = conflicts
+        self.tableModel.reload(self.storage.merge(data, known, theirs))
+    
+    def readChangedList(self, fileName, current, isUsed):
+        # The list in a changed Consoles.txt or Status.txt, None if it is the list of the program.
+        # Names that are still used by a game stay in the list
+        names = list(dict.fromkeys(name for name in open(fileName).read().splitlines() if name.strip() != ""))
+        if names == current:
+            return None  # Written by the program itself
+        if self.saveWorker.isPending(fileName) and self.keepChanges(fileName + " was changed by another "
+                                                                    "program before the changes made here were saved."):
+            return None  # The changes made here are written over it
+        return names + [name for name in current if name not in names and isUsed(name)]
+    
+    def reloadConsoles(self):
+        consoles = self.readChangedList(self.list.path("Consoles.txt"), self.consoles, self.tableModel.isConsoleUsed)
+        if consoles is None:
+            return
+        for console in consoles:
+            if console not in self.consoles:
+                self.tableModel.addConsole(console)
+        self.consoles = consoles
+        if self.saveWorker.isPending(self.list.path("Consoles.txt")):
+            self.saveConsoles()
+    
+    def reloadStatuses(self):
+        statuses = self.readChangedList(self.list.path("Status.txt"), self.status, self.tableModel.isStatusUsed)
+        if statuses is None:
+            return
+        self.tableModel.setStatuses(statuses, {})
+        self.status = statuses
+        if self.saveWorker.isPending(self.list.path("Status.txt")):
+            self.saveStatuses()
+    
+    
+    # ----- Statistics Functions -----
+    
+    def openStatisticsDialog(self):
+        # The dialog stays open next to the main window and is updated whenever the games
+        # or the rows shown change, from the counts the games keep up to date
+        if self.statisticsDialog is not None:
+            self.statisticsDialog.raise_()
+            return
+        from StatisticsDialog import Ui_Dialog as statisticsDialog
+        self.statisticsDialog = QtWidgets.QDialog(self)
+        self.statisticsDialog.ui = statisticsDialog()
+        self.statisticsDialog.ui.setupUi(self.statisticsDialog)
+        
+        # Add events
+        self.statisticsDialog.ui.checkBox_shown.toggled.connect(self.showStatistics)
+        self.statisticsDialog.ui.button_close.clicked.connect(self.statisticsDialog.close)
+        self.statisticsDialog.finished.connect(self.statisticsDialogClosed)
+        
+        self.showStatistics()
+        self.statisticsDialog.show()
+    
+    def statisticsDialogClosed(self):
+        self.statisticsDialog = None
+    
+    def showStatistics(self):
+        if self.statisticsDialog is None:
+            return
+        ui = self.statisticsDialog.ui
+        stats = self.tableModel.statistics(ui.checkBox_shown.isChecked())
+        
+        def average(summary):
+            return "" if summary["average"] is None else str(summary["average"])
+        
+        # Games per status (rows) and console (columns), with the totals and average scores
+        statuses = list(stats["status"])
+        consoles = list(stats["console"])
+        rows = [[stats["counts"][status][console] for console in consoles] +
+                [summary["games"], summary["scored"], average(summary)]
+                for status, summary in stats["status"].items()]
+        rows.append([summary["games"] for summary in stats["console"].values()] +
+                    [stats["games"], stats["scored"], average(stats)])
+        table = ui.table_counts
+        table.setRowCount(len(rows))
+        table.setColumnCount(len(consoles) + 3)
+        table.setVerticalHeaderLabels(statuses + ["Total"])
+        table.setHorizontalHeaderLabels(consoles + ["Total", "Scored", "Average score"])
+        for row, values in enumerate(rows):
+            for column, value in enumerate(values):
+                table.setItem(row, column, QtWidgets.QTableWidgetItem(str(value)))
+        
+        # Games per score
+        table = ui.table_scores
+        table.setRowCount(len(stats["histogram"]))
+        table.setVerticalHeaderLabels(list(stats["histogram"]))
+        for row, count in enumerate(stats["histogram"].values()):
+            table.setItem(row, 0, QtWidgets.QTableWidgetItem(str(count)))
+        
+        ui.label_total.setText(str(stats["games"]) + " games, " + str(stats["scored"]) + " with a score")
+    
+    
+    # ----- Performance Functions -----
+    
+    def openPerformanceDialog(self):
+        # The dialog stays open next to the main window and shows the numbers as they change
+        if self.performanceDialog is not None:
+            self.performanceDialog.raise_()
+            return
+        from PerformanceDialog import Ui_Dialog as performanceDialog
+        self.performanceDialog = QtWidgets.QDialog(self)
+        self.performanceDialog.ui = performanceDialog()
+        self.performanceDialog.ui.setupUi(self.performanceDialog)
+        self.performanceDialog.ui.tableWidget.setColumnWidth(0, 180)
+        
+        # Add events
+        self.performanceDialog.ui.button_reset.clicked.connect(self.resetPerformance)
+        self.performanceDialog.ui.button_save.clicked.connect(self.savePerformance)
+        self.performanceDialog.ui.button_close.clicked.connect(self.performanceDialog.close)
+        self.performanceDialog.finished.connect(self.performanceDialogClosed)
+        self.performanceDialog.timer = QtCore.QTimer(self.performanceDialog)
+        self.performanceDialog.timer.timeout.connect(self.showPerformance)
+        self.performanceDialog.timer.start(1000)
+        
+        self.showPerformance()
+        self.performanceDialog.show()
+    
+    def performanceDialogClosed(self):
+        self.performanceDialog.timer.stop()
+        self.performanceDialog = None
+    
+    def showPerformance(self):
+        table = self.performanceDialog.ui.tableWidget
+        report = self.profiler.report()
+        table.setRowCount(len(report))
+        for row, (name, count, p50, p95, slowest, total) in enumerate(report):
+            texts = [name, str(count)] + [str(round(seconds * 1000, 2)) for seconds in (p50, p95, slowest)]
+            for column, text in enumerate(texts):
+                table.setItem(row, column, QtWidgets.QTableWidgetItem(text))
+    
+    def resetPerformance(self):
+        self.profiler.reset()
+        self.showPerformance()
+    
+    def savePerformance(self):
+        fileName, _ = QFileDialog.getSaveFileName(self, "Save performance data", "Performance.json",
+                                                  "JSON files (*.json);;All files (*)")
+        if fileName == "":
+            return
+        try:
+            self.profiler.dump(fileName)
+        except OSError as error:
+            message = QMessageBox(text = ("Could not save " + fileName + ":\n" + str(error)))
+            message.setWindowTitle("Error")
+            message.exec()
+    
+    
     # ----- Search Functions -----
     
     def clearSearch(self):
         # Clear search field and reload displayed data
         self.ui.lineEdit_search.clear()
+        self.searchTimer.stop()
         self.tableModel.filterSortData(text="")
     
     def applyFilter(self, text):
-        self.tableModel.filterSortData(text=text)
+        # Wait for the next key, every key restarts the timer
+        self.searchTimer.start()
+    
+    def startSearch(self):
+        self.tableModel.search(self.ui.lineEdit_search.text())
+    
+    def searchingChanged(self, searching):
+        if searching:
+            self.slowSearchTimer.start()
+        else:
+            self.slowSearchTimer.stop()
+            self.ui.label_searching.setText("")
         
 
 if __name__ == "__main__":
-    app = QApplication(sys.argv)
-    widget = GamesList()
+    parser = argparse.ArgumentParser()
+    parser.add_argument("directories", nargs="*", default=["."], metavar="DIRECTORY",
+                        help="The folders of the lists to open, the first one is shown (default: the current one)")
+    parser.add_argument("--storage", choices=["csv", "binary", "sqlite"],
+                        help="Keep the games in Games.txt (csv), Games.bin (binary) or Games.db (sqlite). "
+                             "Defaults to sqlite if Games.db exists, binary if Games.bin exists, otherwise csv")
+    parser.add_argument("--memory", type=float, default=512, metavar="MB",
+                        help="Lists that were shown before stay loaded while they fit in this (default: 512)")
+    parser.add_argument("--profile", action="store_true",
+                        help="Measure how long the program takes for everything, see Debug > Performance...")
+    parser.add_argument("--slow", type=float, default=100, metavar="MILLISECONDS",
+                        help="While profiling, log operations taking longer than this to Slow.log (default: 100)")
+    args, qt_args = parser.parse_known_args()
+    
+    app = QApplication(sys.argv[:1] + qt_args)
+    widget = GamesList(args.storage, Profiler(args.profile, args.slow / 1000), args.directories, args.memory)
     widget.show()
+    app.processEvents()  # Draw the window before loading the games
+    widget.loadGames()
     app.exec_()
@@ -0,0 +1,79 @@
+import json
+import numpy as np
+import pandas as pd
+
+
+# Games can be imported from a CSV file (separated by "," or "$", like Games.txt) or a JSON
+# file (a list of objects, or one object per line). Title, Status and Console are required,
+# Score is optional. Columns are matched regardless of case
+
+
+def read_games(fileName, chunksize=10000):
+    # Yields the games in the file as DataFrames of at most chunksize rows, with a "Line" column
+    # holding the position of each game in the file, counted from 1
+    first = 1
+    for chunk in read_chunks(fileName, chunksize):
+        chunk = chunk.rename(columns={column: column.strip().capitalize() for column in chunk.columns})
+        for column in ["Title", "Status", "Console"]:
+            if column not in chunk.columns:
+                raise ValueError("The file has no \"" + column + "\" column.")
+        if "Score" not in chunk.columns:
+            chunk["Score"] = ""
+        chunk = chunk[["Title", "Status", "Console", "Score"]].fillna("").astype(str)
+        chunk.insert(0, "Line", np.arange(first, first + chunk.shape[0]))
+        first += chunk.shape[0]
+        yield chunk
+
+
+def read_chunks(fileName, chunksize):
+    if fileName.lower().endswith((".json", ".jsonl")):
+        with open(fileName) as f:
+            text = f.read()
+        if text.lstrip().startswith("["):
+            games = pd.DataFrame(json.loads(text), dtype=str)
+            for start in range(0, games.shape[0], chunksize):
+                yield games.iloc[start:start+chunksize]
+        else:
+            yield from pd.read_json(fileName, lines=True, dtype=False, chunksize=chunksize)
+        return
+
+    with open(fileName) as f:
+        sep = "$" if "$" in f.readline() else ","
+    yield from pd.read_csv(fileName, sep=sep, dtype=str, keep_default_na=False, chunksize=chunksize)
+
+
+def validate_games(chunk, statuses, consoles, taken):
+    # Splits a chunk from read_games into the games that can be added and the ones that can't.
+    # Statuses and consoles are matched to the given ones regardless of case and surrounding spaces,
+    # taken is the set of titles already in use (titles accepted here are added to it).
+    # Returns the accepted games (Title, Status, Console, Score) and a list of
+    # (line, title, reason) for the rejected ones
+    title = chunk["Title"]
+    status = chunk["Status"].str.strip().str.casefold().map({s.casefold(): s for s in statuses})
+    console = chunk["Console"].str.strip().str.casefold().map({c.casefold(): c for c in consoles})
+
+    # Scores are 0 to 10 in steps of 0.5, anything that means "no score" becomes -1 like in the program
+    score_text = chunk["Score"].str.strip()
+    no_score = score_text.str.casefold().isin(["", "no score", "-1", "-1.0"])
+    score = pd.to_numeric(score_text, errors="coerce")
+    valid_score = (score >= 0) & (score <= 10) & ((score * 2) % 1 == 0)
+    score = score.where(~no_score, -1.0)
+
+    # The first problem found for each game is the one reported
+    reasons = pd.Series("", index=chunk.index)
+    checks = [(title.str.strip() == "", "Missing title"),
+              (title.str.contains("$", regex=False), "The symbol \"$\" is reserved"),
+              (title.str.contains(r"[\x00-\x1f\x7f]"), "Line breaks and control characters aren't allowed"),
+              (title.isin(taken), "Title already exists"),
+              (title.duplicated(), "Title appears more than once"),
+              (status.isna(), "Unknown status"),
+              (console.isna(), "Unknown console"),
+              (~(no_score | valid_score), "Invalid score")]
+    for failed, reason in reversed(checks):
+        reasons[failed] = reason
+
+    accepted = reasons == ""
+    games = pd.DataFrame({"Title": title, "Status": status, "Console": console, "Score": score})[accepted]
+    taken.update(games["Title"])
+    rejected = list(zip(chunk["Line"][~accepted], title[~accepted], reasons[~accepted]))
+    return games, rejected
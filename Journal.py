@@ -0,0 +1,156 @@
+import os
+import pandas as pd
+from FileWriter import write_games
+
+
+def stat_stamp(info):
+    # Modification time and size of a file from os.stat
+    return str(info.st_mtime_ns) + " " + str(info.st_size)
+
+
+class Journal():
+    # Changes to the games file are appended as one line each to a journal next to it,
+    # instead of rewriting the whole file on every edit. Records are "$"-separated like
+    # the games file itself:
+    #   add$Title$Status$Console$Score
+    #   update$Old title$Title$Status$Console$Score
+    #   delete$Title
+    #   rename$Old console$New console
+    #   statuses$Old status$New status$Old status$New status...  (all renamed at once)
+    # Once the journal grows past the threshold (in bytes), the games file is rewritten
+    # by the save worker and the journal starts over.
+    # Renames can't be applied twice (swapping two statuses would swap them back), so while
+    # the games file is rewritten the old journal is kept with a stamp of the new file. If the
+    # program stops after the file is replaced but before the old journal is removed, the stamp
+    # matches the file and the old journal is skipped
+
+    def __init__(self, fileName, threshold=256*1024, journalName=None, write=write_games):
+        # write is the function the games file is written with (see FileWriter.py)
+        self.fileName = fileName
+        self.journalName = journalName or os.path.splitext(fileName)[0] + ".journal"
+        self.write = write
+        self.oldName = self.journalName + ".old"  # The journal of a compaction in progress
+        self.foldedName = self.journalName + ".folded"  # The stamp of the file that includes it
+        self.threshold = threshold
+        self._size = os.path.getsize(self.journalName) if os.path.exists(self.journalName) else 0
+        self._compacting = False
+        self._done = None
+
+    def replay(self, data):
+        # Apply the journaled changes to the data read from the games file.
+        # Renames are done on the names as text, since a categorical column can't swap or merge names
+        changed = {}  # Title -> new row, or None if the game was deleted
+        for record in self.records():
+            if record[0] == "add" and len(record) == 5:
+                changed[record[1]] = record[1:]
+            elif record[0] == "update" and len(record) == 6:
+                changed[record[1]] = None
+                changed[record[2]] = record[2:]
+            elif record[0] == "delete" and len(record) == 2:
+                changed[record[1]] = None
+            elif record[0] == "rename" and len(record) == 3:
+                data["Console"] = data["Console"].astype(object).replace({record[1]:record[2]})
+                for row in changed.values():
+                    if row is not None and row[2] == record[1]:
+                        row[2] = record[2]
+            elif record[0] == "statuses" and len(record) % 2 == 1:
+                renamed = dict(zip(record[1::2], record[2::2]))
+                data["Status"] = data["Status"].astype(object).replace(renamed)
+                for row in changed.values():
+                    if row is not None:
+                        row[1] = renamed.get(row[1], row[1])
+
+        if not changed:
+            return data
+        rows = [[row[0], row[1], row[2], float(row[3])] for row in changed.values() if row is not None]
+        data = data[~data["Title"].isin(list(changed))]
+        rows = pd.DataFrame(rows, columns=["Title", "Status", "Console", "Score"])
+        return pd.concat([data, rows], ignore_index=True)
+
+    def records(self):
+        # The records of the old journal (unless it is already part of the games file)
+        # and the journal, in the order they were written
+        for name in (self.oldName, self.journalName):
+            if not os.path.exists(name) or (name == self.oldName and self.isFolded()):
+                continue
+            with open(name) as f:
+                for line in f:
+                    if line.endswith("\n"):  # Not cut short by a crash
+                        yield line[:-1].split("$")
+
+    def titles(self):
+        # The titles of the games that were added, changed or deleted by the journaled changes
+        titles = set()
+        for record in self.records():
+            if record[0] in ("add", "delete"):
+                titles.add(record[1])
+            elif record[0] == "update":
+                titles.update(record[1:3])
+        return titles
+
+    def append(self, *records):
+        # All records are written (and synced) at once
+        lines = "".join("$".join(str(field) for field in record) + "\n" for record in records)
+        with open(self.journalName, "a") as f:
+            f.write(lines)
+            f.flush()
+            os.fsync(f.fileno())
+        self._size += len(lines.encode())
+
+    def isFull(self):
+        return self._size > self.threshold
+
+    def isFolded(self):
+        # Whether the games file was written from a snapshot that includes the old journal
+        if not os.path.exists(self.foldedName) or not os.path.exists(self.fileName):
+            return False
+        with open(self.foldedName) as f:
+            return f.read() == stat_stamp(os.stat(self.fileName))
+
+    def compact(self, snapshot, saveWorker, done=None):
+        # Rewrite the games file from a snapshot of the data that includes every journaled change.
+        # snapshot is a function returning it, only called if the file is rewritten.
+        # done is called like the save worker's callback once the file is written
+        if self._compacting:
+            return  # The journal keeps growing until the running compaction is done
+        if os.path.exists(self.oldName) and self.isFolded():
+            os.remove(self.oldName)
+        if os.path.exists(self.foldedName):
+            os.remove(self.foldedName)
+        if not os.path.exists(self.journalName) and not os.path.exists(self.oldName):
+            return
+
+        # New changes go to a fresh journal, the current one is kept until the games file is replaced
+        if os.path.exists(self.journalName):
+            if os.path.exists(self.oldName):  # Left behind by an interrupted compaction
+                with open(self.journalName) as f, open(self.oldName, "a") as old:
+                    old.write(f.read())
+                os.remove(self.journalName)
+            else:
+                os.replace(self.journalName, self.oldName)
+        self._size = 0
+
+        self._compacting = True
+        self._done = done
+        saveWorker.save(self.fileName, self.writeFolded, snapshot(), self.compacted)
+
+    def writeFolded(self, f, snapshot):
+        # Write the games file, then the stamp it will have once it replaces the current one
+        # (replacing a file keeps its modification time and size)
+        self.write(f, snapshot)
+        f.flush()
+        with open(self.foldedName, "w") as folded:
+            folded.write(stat_stamp(os.fstat(f.fileno())))
+            folded.flush()
+            os.fsync(folded.fileno())
+
+    def compacted(self, error):
+        # If the games file couldn't be written, the old journal is kept and merged
+        # with the next one
+        if error is None:
+            os.remove(self.oldName)
+        if os.path.exists(self.foldedName):
+            os.remove(self.foldedName)
+        self._compacting = False
+        if self._done is not None:
+            self._done(error)
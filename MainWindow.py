@@ -14,9 +14,9 @@ from PyQt5 import QtCore, QtGui, QtWidgets
 class Ui_MainWindow(object):
     def setupUi(self, MainWindow):
         MainWindow.setObjectName("MainWindow")
-        MainWindow.resize(850, 420)
-        MainWindow.setMinimumSize(QtCore.QSize(850, 420))
-        MainWindow.setMaximumSize(QtCore.QSize(850, 420))
+        MainWindow.resize(850, 470)
+        MainWindow.setMinimumSize(QtCore.QSize(850, 470))
+        MainWindow.setMaximumSize(QtCore.QSize(850, 470))
         self.centralwidget = QtWidgets.QWidget(MainWindow)
         self.centralwidget.setObjectName("centralwidget")
         self.horizontalLayout = QtWidgets.QHBoxLayout(self.centralwidget)
@@ -30,6 +30,11 @@ class Ui_MainWindow(object):
         self.verticalLayout = QtWidgets.QVBoxLayout()
         self.verticalLayout.setSpacing(5)
         self.verticalLayout.setObjectName("verticalLayout")
+        self.comboBox_lists = QtWidgets.QComboBox(self.centralwidget)
+        self.comboBox_lists.setMinimumSize(QtCore.QSize(200, 25))
+        self.comboBox_lists.setMaximumSize(QtCore.QSize(200, 25))
+        self.comboBox_lists.setObjectName("comboBox_lists")
+        self.verticalLayout.addWidget(self.comboBox_lists)
         self.button_add = QtWidgets.QPushButton(self.centralwidget)
         self.button_add.setMinimumSize(QtCore.QSize(200, 50))
         self.button_add.setMaximumSize(QtCore.QSize(200, 50))
@@ -45,6 +50,16 @@ class Ui_MainWindow(object):
         self.button_consoles.setMaximumSize(QtCore.QSize(200, 50))
         self.button_consoles.setObjectName("button_consoles")
         self.verticalLayout.addWidget(self.button_consoles)
+        self.button_statuses = QtWidgets.QPushButton(self.centralwidget)
+        self.button_statuses.setMinimumSize(QtCore.QSize(200, 50))
+        self.button_statuses.setMaximumSize(QtCore.QSize(200, 50))
+        self.button_statuses.setObjectName("button_statuses")
+        self.verticalLayout.addWidget(self.button_statuses)
+        self.button_statistics = QtWidgets.QPushButton(self.centralwidget)
+        self.button_statistics.setMinimumSize(QtCore.QSize(200, 50))
+        self.button_statistics.setMaximumSize(QtCore.QSize(200, 50))
+        self.button_statistics.setObjectName("button_statistics")
+        self.verticalLayout.addWidget(self.button_statistics)
         spacerItem = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
         self.verticalLayout.addItem(spacerItem)
         self.lineEdit_search = QtWidgets.QLineEdit(self.centralwidget)
@@ -53,6 +68,12 @@ class Ui_MainWindow(object):
         self.lineEdit_search.setInputMask("")
         self.lineEdit_search.setObjectName("lineEdit_search")
         self.verticalLayout.addWidget(self.lineEdit_search)
+        self.label_searching = QtWidgets.QLabel(self.centralwidget)
+        self.label_searching.setMinimumSize(QtCore.QSize(200, 15))
+        self.label_searching.setMaximumSize(QtCore.QSize(200, 15))
+        self.label_searching.setText("")
+        self.label_searching.setObjectName("label_searching")
+        self.verticalLayout.addWidget(self.label_searching)
         self.button_clear = QtWidgets.QPushButton(self.centralwidget)
         self.button_clear.setMinimumSize(QtCore.QSize(200, 50))
         self.button_clear.setMaximumSize(QtCore.QSize(200, 50))
@@ -64,7 +85,22 @@ class Ui_MainWindow(object):
         self.menubar = QtWidgets.QMenuBar(MainWindow)
         self.menubar.setGeometry(QtCore.QRect(0, 0, 850, 22))
         self.menubar.setObjectName("menubar")
+        self.menuFile = QtWidgets.QMenu(self.menubar)
+        self.menuFile.setObjectName("menuFile")
+        self.menuDebug = QtWidgets.QMenu(self.menubar)
+        self.menuDebug.setObjectName("menuDebug")
         MainWindow.setMenuBar(self.menubar)
+        self.actionOpenList = QtWidgets.QAction(MainWindow)
+        self.actionOpenList.setObjectName("actionOpenList")
+        self.actionImport = QtWidgets.QAction(MainWindow)
+        self.actionImport.setObjectName("actionImport")
+        self.actionPerformance = QtWidgets.QAction(MainWindow)
+        self.actionPerformance.setObjectName("actionPerformance")
+        self.menuFile.addAction(self.actionOpenList)
+        self.menuFile.addAction(self.actionImport)
+        self.menuDebug.addAction(self.actionPerformance)
+        self.menubar.addAction(self.menuFile.menuAction())
+        self.menubar.addAction(self.menuDebug.menuAction())
 
         self.retranslateUi(MainWindow)
         QtCore.QMetaObject.connectSlotsByName(MainWindow)
@@ -72,8 +108,17 @@ class Ui_MainWindow(object):
     def retranslateUi(self, MainWindow):
         _translate = QtCore.QCoreApplication.translate
         MainWindow.setWindowTitle(_translate("MainWindow", "MainWindow"))
+        self.comboBox_lists.setToolTip(_translate("MainWindow", "The games list that is shown, File > Open list... adds another one"))
         self.button_add.setText(_translate("MainWindow", "Add game"))
         self.button_edit.setText(_translate("MainWindow", "Edit selected game"))
         self.button_consoles.setText(_translate("MainWindow", "Edit consoles"))
+        self.button_statuses.setText(_translate("MainWindow", "Edit statuses"))
+        self.button_statistics.setText(_translate("MainWindow", "Statistics"))
+        self.lineEdit_search.setToolTip(_translate("MainWindow", "Search titles, optionally filtered like status:Done console:PC score>=8"))
         self.lineEdit_search.setPlaceholderText(_translate("MainWindow", "Seach game title"))
         self.button_clear.setText(_translate("MainWindow", "Clear search"))
+        self.menuFile.setTitle(_translate("MainWindow", "File"))
+        self.menuDebug.setTitle(_translate("MainWindow", "Debug"))
+        self.actionOpenList.setText(_translate("MainWindow", "Open list..."))
+        self.actionImport.setText(_translate("MainWindow", "Import games..."))
+        self.actionPerformance.setText(_translate("MainWindow", "Performance..."))
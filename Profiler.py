@@ -0,0 +1,108 @@
+import json
+import time
+import threading
+from bisect import bisect_left
+from contextlib import contextmanager
+
+
+# Counts and times the hot paths of the program, to see where it is slow on someone's list.
+# Nothing is measured unless the profiler is enabled: methods are only wrapped by instrument
+# when it is, so a disabled profiler costs nothing. Every operation gets a histogram of its
+# times in buckets that double in size, from which percentiles are estimated. Operations
+# slower than the threshold are also written to a log file as they happen
+
+# Upper bounds of the buckets in seconds, from 10 microseconds to about 170 seconds
+BOUNDS = [0.00001 * 2**i for i in range(25)]
+
+
+class Stats():
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * (len(BOUNDS) + 1)  # The last bucket is for anything slower
+
+    def add(self, seconds):
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        self.buckets[bisect_left(BOUNDS, seconds)] += 1
+
+    def percentile(self, fraction):
+        # The upper bound of the bucket the given fraction of the calls fall in (at most the max)
+        seen = 0
+        for bound, count in zip(BOUNDS + [self.max], self.buckets):
+            seen += count
+            if seen >= fraction * self.count:
+                return min(bound, self.max)
+        return self.max
+
+
+class Profiler():
+
+    def __init__(self, enabled=False, threshold=0.1, logName="Slow.log"):
+        self.enabled = enabled
+        self.threshold = threshold  # Seconds, operations taking longer are logged
+        self.logName = logName
+        self._stats = {}  # Operation -> Stats
+        self._lock = threading.Lock()  # Saves are measured on the save worker's thread
+
+    def record(self, name, seconds):
+        with self._lock:
+            if name not in self._stats:
+                self._stats[name] = Stats()
+            self._stats[name].add(seconds)
+            if seconds > self.threshold:
+                with open(self.logName, "a") as f:
+                    f.write(time.strftime("%Y-%m-%d %H:%M:%S") + " " + name + " took "
+                            + str(round(seconds * 1000, 1)) + " ms\n")
+
+    def instrument(self, obj, method, name=None):
+        # Measure every call of a method of obj from now on, if the profiler is enabled.
+        # The method is replaced on the object itself, which Qt also calls through
+        if not self.enabled:
+            return
+        function = getattr(obj, method)
+        name = name or method
+
+        def measured(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self.record(name, time.perf_counter() - start)
+        setattr(obj, method, measured)
+
+    @contextmanager
+    def timer(self, name):
+        # Measure a block of code, e.g. a step of starting the program
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def report(self):
+        # A row per operation: name, calls, p50, p95, max and total time (in seconds)
+        with self._lock:
+            return [[name, stats.count, stats.percentile(0.5), stats.percentile(0.95), stats.max, stats.total]
+                    for name, stats in sorted(self._stats.items())]
+
+    def reset(self):
+        with self._lock:
+            self._stats = {}
+
+    def dump(self, fileName):
+        # Write the report and the histograms as JSON
+        with self._lock:
+            data = {"bounds": BOUNDS, "threshold": self.threshold,
+                    "operations": {name: {"count": stats.count, "total": stats.total, "max": stats.max,
+                                          "p50": stats.percentile(0.5), "p95": stats.percentile(0.95),
+                                          "buckets": stats.buckets}
+                                   for name, stats in self._stats.items()}}
+        with open(fileName, "w") as f:
+            json.dump(data, f, indent=2)
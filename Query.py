@@ -0,0 +1,80 @@
+import re
+import math
+
+
+# The search box takes a title text and optionally filters on the other columns, e.g.
+#   status:Done console:PC score>=8 zelda
+# status: and console: take a name, several names separated by commas or a quoted name with
+# spaces (console:"Wii U"). A name matches exactly if a status or console has it, otherwise
+# every name starting with it matches (regardless of case), so the list narrows while typing.
+# score takes :, =, >=, >, <= or < and a number, or score:none for games without a score.
+# Everything else is the title text, a text without filters is searched exactly as typed.
+# A filter without a value (still being typed) is ignored. A title text starting with ~ is
+# searched fuzzily, finding titles with typos or words in another order (see FuzzyIndex.py)
+
+TERM = re.compile(r'(?<!\S)(status|console|score)(>=|<=|:|=|>|<)("[^"]*"?|[^\s"]*)(?!\S)', re.IGNORECASE)
+
+
+class Query():
+
+    def __init__(self, text):
+        self.status = None  # The names given for a column, None if it isn't filtered
+        self.console = None
+        self.score = None  # (lowest, highest) score, inclusive
+
+        # ~ can come before or after the filters
+        self.fuzzy = text.lstrip().startswith("~")
+        if self.fuzzy:
+            text = text.lstrip()[1:]
+
+        rest = []
+        last = 0
+        for term in TERM.finditer(text):
+            if self.addTerm(term.group(1).lower(), term.group(2), term.group(3).strip('"')):
+                rest.append(text[last:term.start()])
+                last = term.end()
+        if last == 0:
+            self.text = text
+        else:
+            rest.append(text[last:])
+            self.text = " ".join("".join(rest).split())
+        if self.text.startswith("~"):
+            self.fuzzy = True
+            self.text = self.text[1:]
+
+    def addTerm(self, column, operator, value):
+        # Returns whether the term is a filter, terms that aren't are part of the title text
+        if value == "":
+            return True
+        if column in ("status", "console"):
+            if operator != ":":
+                return False
+            names = [name.strip() for name in value.split(",") if name.strip() != ""]
+            setattr(self, column, (getattr(self, column) or []) + names)
+            return True
+
+        if value.lower() == "none" and operator in (":", "="):
+            self.score = (-1.0, -1.0)
+            return True
+        try:
+            score = float(value)
+        except ValueError:
+            return False
+        # Games without a score (-1) are never above or below a score
+        self.score = {":": (score, score), "=": (score, score),
+                      ">=": (score, math.inf), ">": (math.nextafter(score, math.inf), math.inf),
+                      "<=": (0.0, score), "<": (0.0, math.nextafter(score, -math.inf))}[operator]
+        return True
+
+    def filters(self):
+        return self.status is not None or self.console is not None or self.score is not None
+
+
+def match_names(values, names):
+    # The names matching any of the values, see the description above
+    matched = []
+    for value in values:
+        value = value.casefold()
+        exact = [name for name in names if name.casefold() == value]
+        matched += exact or [name for name in names if name.casefold().startswith(value)]
+    return list(dict.fromkeys(matched))
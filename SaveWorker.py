@@ -0,0 +1,93 @@
+import threading
+import time
+from collections import Counter
+from PyQt5 import QtCore
+from FileWriter import write_atomic
+
+
+class SaveWorker(QtCore.QThread):
+    # Writes files on a separate thread. Snapshots saved to the same file within the delay
+    # (in seconds) of each other are merged, only the last one is written.
+    # The snapshots must not be changed after they are handed over.
+    # Until the thread is started, files are written immediately on the calling thread.
+    # Callbacks and failed are always called on the thread that created the worker
+
+    failed = QtCore.pyqtSignal(str, str)  # File name, error message
+    written = QtCore.pyqtSignal()  # Files were written on the thread, see deliver
+
+    def __init__(self, delay=0.5):
+        super().__init__()
+        self.delay = delay
+        self._pending = {}  # File name -> (write function, snapshot, done callback)
+        self._writing = Counter()  # Files taken from pending whose callback wasn't called yet
+        self._finished = []  # (file name, done callback, error) of the files written on the thread
+        self._condition = threading.Condition()
+        self._stopping = False
+        self.written.connect(self.deliver, QtCore.Qt.QueuedConnection)
+
+    def save(self, fileName, write, snapshot, done=None):
+        # done is called with None after the file is written, or with the error if it failed
+        if not self.isRunning():
+            self.finish(fileName, done, self.write(fileName, (write, snapshot, done)))
+            return
+        with self._condition:
+            self._pending[fileName] = (write, snapshot, done)
+            self._condition.notify()
+
+    def isPending(self, fileName):
+        # Whether a snapshot of the file is waiting to be written (or its callback to be called)
+        with self._condition:
+            return fileName in self._pending or self._writing[fileName] > 0
+
+    def write(self, fileName, job):
+        # Returns the error, or None if the file was written. Any error is caught,
+        # so the thread keeps writing the files saved after it
+        write, snapshot, done = job
+        try:
+            write_atomic(fileName, write, snapshot)
+        except Exception as error:
+            return error
+        return None
+
+    def finish(self, fileName, done, error):
+        if done is not None:
+            done(error)
+        if error is not None:
+            self.failed.emit(fileName, str(error))
+
+    def deliver(self):
+        # Call the callbacks of the files written on the thread
+        with self._condition:
+            finished, self._finished = self._finished, []
+            self._writing -= Counter(fileName for fileName, done, error in finished)
+        for fileName, done, error in finished:
+            self.finish(fileName, done, error)
+
+    def run(self):
+        while True:
+            with self._condition:
+                while not self._pending and not self._stopping:
+                    self._condition.wait()
+                if not self._pending:
+                    return
+
+                # Give a burst of changes the chance to finish before writing
+                deadline = time.monotonic() + self.delay
+                while not self._stopping and time.monotonic() < deadline:
+                    self._condition.wait(deadline - time.monotonic())
+                pending, self._pending = self._pending, {}
+                self._writing.update(pending.keys())
+
+            for fileName, job in pending.items():
+                error = self.write(fileName, job)
+                with self._condition:
+                    self._finished.append((fileName, job[2], error))
+                self.written.emit()
+
+    def flush(self):
+        # Write everything that is pending right away, stop the thread and call the callbacks
+        with self._condition:
+            self._stopping = True
+            self._condition.notify()
+        self.wait()
+        self.deliver()
@@ -0,0 +1,69 @@
+import threading
+from PyQt5 import QtCore
+from GameLibrary import SearchCancelled
+
+
+class SearchWorker(QtCore.QThread):
+    # Finds the rows matching a search text on a separate thread, so typing doesn't wait for it.
+    # Only the latest request is searched: a new request or cancel() stops the one running.
+    # The games must not be used by another thread while a search runs, so cancel() waits
+    # until it has stopped (which is soon, searches look whether they were cancelled regularly)
+
+    found = QtCore.pyqtSignal(int, object)  # Request number, ids of the rows in order
+
+    def __init__(self, games):
+        super().__init__()
+        self.games = games
+        self._request = None  # (number, text, column, order) of the next search
+        self._number = 0  # The number of the latest request, searches of older ones are cancelled
+        self._busy = False
+        self._condition = threading.Condition()
+        self._stopping = False
+
+    def search(self, text, column, order):
+        # Returns the number the result will be sent with
+        with self._condition:
+            self._number += 1
+            self._request = (self._number, text, column, order)
+            self._condition.notify_all()
+            return self._number
+
+    def cancel(self):
+        with self._condition:
+            self._number += 1
+            self._request = None
+            while self._busy:
+                self._condition.wait()
+
+    def cancelled(self, number):
+        return number != self._number
+
+    def run(self):
+        while True:
+            with self._condition:
+                while self._request is None and not self._stopping:
+                    self._condition.wait()
+                if self._stopping:
+                    return
+                number, text, column, order = self._request
+                self._request = None
+                self._busy = True
+
+            try:
+                result = self.games.findOrder(text, column, order, lambda: self.cancelled(number))
+            except SearchCancelled:
+                result = None
+            finally:
+                with self._condition:
+                    self._busy = False
+                    self._condition.notify_all()
+            if result is not None:
+                self.found.emit(number, result)
+
+    def stop(self):
+        # Cancel any search and stop the thread
+        with self._condition:
+            self._stopping = True
+            self._number += 1
+            self._condition.notify_all()
+        self.wait()
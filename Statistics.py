@@ -0,0 +1,85 @@
+import numpy as np
+
+
+# Number of games and their scores per status and console, kept up to date by GameStore as
+# games are added, changed and deleted, so nothing has to be counted when they are shown.
+# Statuses and consoles are counted by code, renaming one doesn't change anything here.
+# Scores are counted in bins: no score, then 0 to 10 in steps of 0.5
+
+BINS = 22
+SCORES = ["No score"] + [str(score / 2) for score in range(21)]
+
+
+def score_bins(scores):
+    # The bin of each score, scores between two steps go to the nearest one
+    scores = np.asarray(scores, dtype=np.float64)
+    return np.where(scores < 0, 0, np.clip(np.rint(scores * 2), 0, 20) + 1).astype(np.int64)
+
+
+def shown(categories):
+    # The names in their order, then the ones that aren't in it but are used by a game
+    used = [name for name in categories.names
+            if name is not None and name not in categories.order and categories.count(name) > 0]
+    return list(categories.order) + used
+
+
+class Statistics():
+
+    def __init__(self):
+        self.histogram = np.zeros((0, 0, BINS), dtype=np.int64)  # Status code, console code, bin -> games
+        self.sums = np.zeros((0, 0), dtype=np.float64)  # Status code, console code -> sum of the scores
+
+    def reserve(self, statuses, consoles):
+        # Make room for the given number of status and console codes
+        old = self.sums.shape
+        if statuses <= old[0] and consoles <= old[1]:
+            return
+        shape = (max(statuses, old[0]), max(consoles, old[1]))
+        histogram = np.zeros(shape + (BINS,), dtype=np.int64)
+        histogram[:old[0], :old[1]] = self.histogram
+        sums = np.zeros(shape, dtype=np.float64)
+        sums[:old[0], :old[1]] = self.sums
+        self.histogram = histogram
+        self.sums = sums
+
+    def add(self, status, console, score, count=1):
+        # Count a game (or arrays of games), count=-1 removes them again
+        self.reserve(np.max(status, initial=-1) + 1, np.max(console, initial=-1) + 1)
+        if np.ndim(status) == 0:
+            self.histogram[status, console, score_bins(score)] += count
+            self.sums[status, console] += count * max(score, 0)
+            return
+        # Several games at once, counted by their position in the flattened arrays
+        cells = np.ravel_multi_index((status, console), self.sums.shape)
+        bins = cells * BINS + score_bins(score)
+        self.histogram += count * np.bincount(bins, minlength=self.histogram.size).reshape(self.histogram.shape)
+        self.sums += count * np.bincount(cells, np.maximum(score, 0), minlength=self.sums.size).reshape(self.sums.shape)
+
+    def report(self, status, console):
+        # The statistics by name, status and console are their Categories. Every status is shown,
+        # consoles only if a game uses them (the registry still has the ones that were removed):
+        #   games, scored    the number of games and of games with a score
+        #   average          their average score (None without any score)
+        #   counts           games per status and console
+        #   status, console  per status or console: games, games with a score and their average score
+        #   histogram        games per score bin, named in SCORES
+        self.reserve(len(status.names), len(console.names))
+        statuses = shown(status)
+        consoles = [name for name in shown(console) if console.count(name) > 0]
+        s = np.array([status.codes[name] for name in statuses], dtype=np.int64)
+        c = np.array([console.codes[name] for name in consoles], dtype=np.int64)
+        histogram = self.histogram[np.ix_(s, c)]
+        sums = self.sums[np.ix_(s, c)]
+        counts = histogram.sum(axis=2)
+        scored = histogram[:, :, 1:].sum(axis=2)
+
+        def summary(count, score_count, total):
+            return {"games": int(count), "scored": int(score_count),
+                    "average": round(float(total / score_count), 2) if score_count else None}
+        return {**summary(counts.sum(), scored.sum(), sums.sum()),
+                "counts": {name: dict(zip(consoles, row.tolist())) for name, row in zip(statuses, counts)},
+                "status": {name: summary(*values) for name, *values
+                           in zip(statuses, counts.sum(axis=1), scored.sum(axis=1), sums.sum(axis=1))},
+                "console": {name: summary(*values) for name, *values
+                            in zip(consoles, counts.sum(axis=0), scored.sum(axis=0), sums.sum(axis=0))},
+                "histogram": dict(zip(SCORES, histogram.sum(axis=(0, 1)).tolist()))}
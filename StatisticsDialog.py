@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'StatisticsDialog.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.4
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_Dialog(object):
+    def setupUi(self, Dialog):
+        Dialog.setObjectName("Dialog")
+        Dialog.resize(760, 420)
+        Dialog.setMinimumSize(QtCore.QSize(520, 320))
+        self.verticalLayout = QtWidgets.QVBoxLayout(Dialog)
+        self.verticalLayout.setContentsMargins(10, 10, 10, 10)
+        self.verticalLayout.setSpacing(10)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.checkBox_shown = QtWidgets.QCheckBox(Dialog)
+        self.checkBox_shown.setObjectName("checkBox_shown")
+        self.verticalLayout.addWidget(self.checkBox_shown)
+        self.horizontalLayout_tables = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_tables.setSpacing(10)
+        self.horizontalLayout_tables.setObjectName("horizontalLayout_tables")
+        self.table_counts = QtWidgets.QTableWidget(Dialog)
+        self.table_counts.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.table_counts.setObjectName("table_counts")
+        self.table_counts.setColumnCount(0)
+        self.table_counts.setRowCount(0)
+        self.horizontalLayout_tables.addWidget(self.table_counts)
+        self.table_scores = QtWidgets.QTableWidget(Dialog)
+        self.table_scores.setMinimumSize(QtCore.QSize(150, 0))
+        self.table_scores.setMaximumSize(QtCore.QSize(150, 16777215))
+        self.table_scores.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.table_scores.setColumnCount(1)
+        self.table_scores.setObjectName("table_scores")
+        self.table_scores.setRowCount(0)
+        item = QtWidgets.QTableWidgetItem()
+        self.table_scores.setHorizontalHeaderItem(0, item)
+        self.horizontalLayout_tables.addWidget(self.table_scores)
+        self.verticalLayout.addLayout(self.horizontalLayout_tables)
+        self.horizontalLayout = QtWidgets.QHBoxLayout()
+        self.horizontalLayout.setSpacing(10)
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.label_total = QtWidgets.QLabel(Dialog)
+        self.label_total.setText("")
+        self.label_total.setObjectName("label_total")
+        self.horizontalLayout.addWidget(self.label_total)
+        self.button_close = QtWidgets.QPushButton(Dialog)
+        self.button_close.setMaximumSize(QtCore.QSize(100, 16777215))
+        self.button_close.setObjectName("button_close")
+        self.horizontalLayout.addWidget(self.button_close)
+        self.verticalLayout.addLayout(self.horizontalLayout)
+
+        self.retranslateUi(Dialog)
+        QtCore.QMetaObject.connectSlotsByName(Dialog)
+
+    def retranslateUi(self, Dialog):
+        _translate = QtCore.QCoreApplication.translate
+        Dialog.setWindowTitle(_translate("Dialog", "Statistics"))
+        self.checkBox_shown.setText(_translate("Dialog", "Only the games shown in the list (e.g. search results)"))
+        item = self.table_scores.horizontalHeaderItem(0)
+        item.setText(_translate("Dialog", "Games"))
+        self.button_close.setText(_translate("Dialog", "Close"))
@@ -0,0 +1,254 @@
+import os
+import sqlite3
+import pandas as pd
+from BinaryFile import read_binary, write_binary
+from Journal import Journal
+from FileWriter import write_atomic, write_games
+from GameLibrary import diff_games
+
+
+# A storage keeps the games on disk. TableModel describes every change with a record:
+#   ["add", row]
+#   ["update", old title, row]
+#   ["delete", title]
+#   ["rename", old console, new console]
+#   ["import", rows]
+#   ["edit", rows]  (rows that kept their title)
+#   ["statuses", {old status: new status}, {status: categorized}]
+# where row is [Title, Status, Console, Score, reduced, categorized]. Along with the record
+# it passes a function returning a copy of all the data after the change, for storages
+# that rewrite everything
+
+
+class CsvStorage():
+    # Games in a "$"-separated text file, with changes journaled next to it
+    # (or the whole file rewritten on every change if journal is False).
+    # The file also holds the reduced titles. They are only used when loading if the file is
+    # exactly as the program wrote it, which is recorded (modification time and size) in a
+    # stamp file next to it. Otherwise, e.g. after editing the file by hand, they are found again.
+    # Another program (or a sync) may change the file while the program runs. The file is never
+    # written over such a change: the journal is kept instead, until readChanges and merge
+    # brought the change in
+
+    columns = ["Title", "Status", "Console", "Score"]
+
+    def __init__(self, fileName, saveWorker, journal=True):
+        self.fileName = fileName
+        self.stampName = os.path.splitext(fileName)[0] + ".stamp"
+        self.saveWorker = saveWorker
+        self.journal = Journal(fileName) if journal else None
+        self.base = None  # The games in the file (without the journal) when it was last read or written
+        self.known = None  # The stamp of the file at that time
+        self._writing = None  # The games being written to the file
+
+    def load(self):
+        known = self.stamp()
+        data = self.read()
+        if "reduced" not in data or self.readStamp() != known:
+            data["reduced"] = None
+        self.base = data[self.columns].copy()
+        self.known = known
+        if self.journal is not None:
+            data = self.journal.replay(data)
+        return data
+
+    def read(self):
+        return pd.read_csv(self.fileName, sep="$", dtype={"Title": str, "Status": str, "Console": str, "reduced": str})
+
+    def changedOnDisk(self):
+        # Whether another program changed the file since it was last read or written
+        return self.known is not None and os.path.exists(self.fileName) and self.stamp() != self.known
+
+    def readChanges(self):
+        # The file after another program changed it: (games, stamp, titles of the games it changed
+        # that were also changed here, but aren't in the file yet). None if the file didn't change
+        if not self.changedOnDisk():
+            return None
+        known = self.stamp()
+        data = self.read()
+        removed, added = diff_games(self.base, data)
+        changed = set(removed["Title"]) | set(added["Title"])
+        conflicts = changed & self.journal.titles() if self.journal is not None else set()
+        return data, known, conflicts
+
+    def merge(self, data, known, theirs=()):
+        # Use the games read by readChanges as the file. The changes that aren't in it yet are
+        # applied on top, except to the titles in theirs, which keep the version of the file.
+        # Returns all the games
+        data = data[self.columns].copy()
+        self.base = data.copy()
+        self.known = known
+        if self.journal is None:
+            return data
+        if theirs:
+            rows = dict(zip(data["Title"], data.values.tolist()))
+            self.journal.append(*(["add"] + rows[title] if title in rows else ["delete", title] for title in theirs))
+        return self.journal.replay(data)
+
+    def stamp(self):
+        info = os.stat(self.fileName)
+        return str(info.st_mtime_ns) + " " + str(info.st_size)
+
+    def readStamp(self):
+        if not os.path.exists(self.stampName):
+            return None
+        with open(self.stampName) as f:
+            return f.read()
+
+    def writing(self, snapshot):
+        # The snapshot that is about to be written to the file, see written
+        self._writing = snapshot
+        return snapshot
+
+    def written(self, error):
+        # Called by the save worker after the games file is written
+        if error is None:
+            self.base = self._writing[self.columns]
+            self.known = self.stamp()
+            with open(self.stampName, "w") as f:
+                f.write(self.known)
+
+    def compact(self, snapshot):
+        # Fold the journal into the file, unless another program changed the file in the meantime
+        if not self.changedOnDisk():
+            self.journal.compact(lambda: self.writing(snapshot()), self.saveWorker, self.written)
+
+    def save(self, record, snapshot):
+        if self.journal is None:
+            self.saveWorker.save(self.fileName, write_games, self.writing(snapshot()), self.written)
+            return
+
+        # The journal only needs the columns that aren't derived from others
+        if record[0] == "add":
+            self.journal.append(["add"] + record[1][:4])
+        elif record[0] == "update":
+            self.journal.append(["update", record[1]] + record[2][:4])
+        elif record[0] == "import":
+            self.journal.append(*(["add"] + row[:4] for row in record[1]))
+        elif record[0] == "edit":
+            self.journal.append(*(["update", row[0]] + row[:4] for row in record[1]))
+        elif record[0] == "statuses":
+            # categorized is found from Status.txt when loading, so only renames are journaled
+            if record[1]:
+                self.journal.append(["statuses"] + [name for pair in record[1].items() for name in pair])
+        else:
+            self.journal.append(record)
+        if self.journal.isFull():
+            self.compact(snapshot)
+
+    def close(self, snapshot):
+        # Fold the journal into the games file, so the file is complete while the program isn't running
+        if self.journal is not None:
+            self.compact(snapshot)
+
+
+class BinaryStorage(CsvStorage):
+    # Games in a binary file with a block of data per column (see BinaryFile.py), which is
+    # faster to load than the games file. Changes are journaled the same way, in their own journal
+
+    def __init__(self, fileName, saveWorker):
+        self.fileName = fileName
+        self.saveWorker = saveWorker
+        self.journal = Journal(fileName, journalName=fileName + ".journal", write=write_binary)
+        self.known = None  # The binary file isn't watched for changes by other programs
+
+    def load(self):
+        # Reduced titles are only written by the program, so they are always used
+        return self.journal.replay(read_binary(self.fileName))
+
+    def migrate(self, data):
+        # Write the games of another storage, e.g. the games file, as the binary file
+        write_atomic(self.fileName, write_binary, data)
+
+    def written(self, error):
+        pass
+
+
+class SqliteStorage():
+    # Games in an SQLite database, every change is written as its own transaction.
+    # Titles are unique, and the games are indexed in the order they are loaded in
+
+    columns = ["Title", "Status", "Console", "Score", "reduced", "categorized"]
+
+    def __init__(self, fileName):
+        self.fileName = fileName
+        self.connection = sqlite3.connect(fileName)
+        with self.connection:
+            self.connection.execute("CREATE TABLE IF NOT EXISTS games (Title TEXT PRIMARY KEY, Status TEXT, "
+                                    "Console TEXT, Score REAL, reduced TEXT, categorized INTEGER)")
+            self.connection.execute("CREATE INDEX IF NOT EXISTS games_status ON games (categorized, reduced)")
+            # Earlier versions also indexed the other columns, which every change had to update while
+            # only renaming a console (which is rare, a scan will do) read one of them
+            for index in ["games_reduced", "games_console", "games_score"]:
+                self.connection.execute("DROP INDEX IF EXISTS " + index)
+
+    def isEmpty(self):
+        return self.connection.execute("SELECT NOT EXISTS (SELECT 1 FROM games)").fetchone()[0]
+
+    def migrate(self, data):
+        # Copy the games of another storage, e.g. the games file, into the database
+        with self.connection:
+            self.connection.executemany("INSERT OR REPLACE INTO games VALUES (?, ?, ?, ?, ?, ?)",
+                                        data[self.columns].astype(object).values.tolist())
+
+    def load(self):
+        # Read in the order of the status index, which is the order the games file is kept in
+        return pd.read_sql_query("SELECT " + ", ".join(self.columns) + " FROM games "
+                                 "ORDER BY categorized, reduced", self.connection)
+
+    def save(self, record, snapshot):
+        with self.connection:
+            if record[0] == "add":
+                self.connection.execute("INSERT INTO games VALUES (?, ?, ?, ?, ?, ?)", record[1])
+            elif record[0] == "update":
+                self.connection.execute("UPDATE games SET Title = ?, Status = ?, Console = ?, Score = ?, "
+                                        "reduced = ?, categorized = ? WHERE Title = ?",
+                                        record[2] + [record[1]])
+            elif record[0] == "delete":
+                self.connection.execute("DELETE FROM games WHERE Title = ?", (record[1],))
+            elif record[0] == "rename":
+                self.connection.execute("UPDATE games SET Console = ? WHERE Console = ?",
+                                        (record[2], record[1]))
+            elif record[0] == "import":
+                self.connection.executemany("INSERT INTO games VALUES (?, ?, ?, ?, ?, ?)", record[1])
+            elif record[0] == "edit":
+                self.connection.executemany("UPDATE games SET Status = ?, Console = ?, Score = ?, "
+                                            "categorized = ? WHERE Title = ?",
+                                            [row[1:4] + [row[5], row[0]] for row in record[1]])
+            elif record[0] == "statuses":
+                # One statement, so statuses that swap names don't run into each other
+                # A status that was renamed away from has no games left, even if its name is used again
+                renamed, status_dict = record[1], record[2]
+                inverse = {new: old for old, new in renamed.items()}
+                old = {status: inverse.get(status, status) for status in status_dict
+                       if status in inverse or status not in renamed}
+                cases = " ".join("WHEN ? THEN ?" for status in old)
+                self.connection.execute("UPDATE games SET Status = CASE Status " + cases + " ELSE Status END, "
+                                        "categorized = CASE Status " + cases + " ELSE categorized END",
+                                        [name for status in old for name in (old[status], status)] +
+                                        [value for status in old for value in (old[status], status_dict[status])])
+
+    def close(self, snapshot):
+        self.connection.close()
+
+
+def open_storage(kind, saveWorker, prepare, directory="."):
+    # The storage named by kind ("csv", "binary" or "sqlite") in the directory of a list. A new
+    # binary file or database starts out with the games of the games file, if there is one.
+    # prepare adds the hidden columns to loaded data
+    games = os.path.join(directory, "Games.txt")
+    if kind == "csv":
+        return CsvStorage(games, saveWorker)
+    if kind == "binary":
+        storage = BinaryStorage(os.path.join(directory, "Games.bin"), saveWorker)
+        if not os.path.exists(storage.fileName):
+            if os.path.exists(games):
+                storage.migrate(prepare(CsvStorage(games, saveWorker).load()))
+            else:
+                storage.migrate(pd.DataFrame(columns=["Title", "Status", "Console", "Score", "reduced"]))
+        return storage
+
+    storage = SqliteStorage(os.path.join(directory, "Games.db"))
+    if storage.isEmpty() and os.path.exists(games):
+        storage.migrate(prepare(CsvStorage(games, saveWorker).load()))
+    return storage